@@ -1,8 +1,9 @@
 """Document management operations for Word documents."""
 
 import os
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set, Tuple
 from docx import Document
 from docx.shared import Inches
 
@@ -22,6 +23,16 @@ class DocumentManager:
     def __init__(self):
         """Initialize document manager."""
         self._documents: Dict[str, Document] = {}
+        # (mtime_ns, size) of the file each cached document was read from or
+        # last saved to; None for documents that only exist in memory
+        self._signatures: Dict[str, Optional[Tuple[int, int]]] = {}
+        # Documents with in-memory changes that have not been saved
+        self._modified: Set[str] = set()
+        # Bumped on every mark_modified, so derived caches can tell when the
+        # cached document has changed since they were built
+        self._revisions: Dict[str, int] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
     
     def open_document(self, file_path: str, create_if_not_exists: bool = True) -> OperationResponse:
         """
@@ -39,9 +50,12 @@ class DocumentManager:
             is_new = False
             
             if path.exists():
-                # Validate and open existing file
-                validate_file_path(file_path, must_exist=True)
-                document = Document(str(path))
+                # Reuse the cached parse while it still matches the file;
+                # otherwise validate and open the existing file
+                document = self._fresh_cached_document(file_path)
+                if document is None:
+                    validate_file_path(file_path, must_exist=True)
+                    document = Document(str(path))
                 message = f"Opened existing document: {file_path}"
             else:
                 if create_if_not_exists:
@@ -53,7 +67,7 @@ class DocumentManager:
                     raise DocumentNotFoundError(f"Document not found: {file_path}")
             
             # Cache the document
-            self._documents[file_path] = document
+            self._cache_document(file_path, document)
             
             # Get document info
             table_count = len(document.tables)
@@ -95,9 +109,14 @@ class DocumentManager:
             # Save the document
             document.save(save_path)
             
-            # Update cache if saving with a new name
-            if save_as:
-                self._documents[save_as] = document
+            # A copy saved under a new name is parsed from disk when it is next
+            # used; caching the same Document under both names would let calls
+            # on either path edit one shared tree
+            if save_as and save_as != file_path:
+                self.flush(save_as)
+            else:
+                self._modified.discard(file_path)
+                self._signatures[file_path] = self._stat_signature(file_path)
             
             message = f"Document saved to: {save_path}"
             data = {"file_path": save_path}
@@ -154,7 +173,7 @@ class DocumentManager:
                     raise DocumentNotFoundError(f"Document not found: {file_path}")
             
             # Cache the document
-            self._documents[file_path] = document
+            self._cache_document(file_path, document)
             
             return document
             
@@ -163,6 +182,112 @@ class DocumentManager:
         except Exception as e:
             raise DocumentAccessError(f"Failed to load document {file_path}: {str(e)}")
     
+    def get_cached_or_load(self, file_path: str) -> Document:
+        """
+        Get a document, reusing the cached one while the file on disk is unchanged.
+        
+        The cached document is keyed by the (mtime_ns, size) of its file. If
+        the file has since been replaced on disk and the cached document has
+        no unsaved changes, it is parsed again; unsaved changes always win.
+        
+        Args:
+            file_path: Path to the document file
+            
+        Returns:
+            Document object
+            
+        Raises:
+            DocumentNotFoundError: If the document is neither cached nor on disk
+            DocumentAccessError: If there's an error accessing the document
+        """
+        with self._path_lock(file_path):
+            document = self._documents.get(file_path)
+            if document is not None:
+                signature = self._signatures.get(file_path)
+                if signature is None or file_path in self._modified:
+                    return document
+                current = self._stat_signature(file_path)
+                if current is None or current == signature:
+                    return document
+                self.flush(file_path)
+            return self.get_or_load_document(file_path)
+    
+    def mark_modified(self, file_path: str) -> None:
+        """
+        Record that a cached document has unsaved in-memory changes.
+        
+        Args:
+            file_path: Path to the document file
+        """
+        if file_path in self._documents:
+            self._modified.add(file_path)
+            self._revisions[file_path] = self._revisions.get(file_path, 0) + 1
+    
+    def get_revision(self, file_path: str) -> int:
+        """
+        Return the modification counter of a cached document.
+        
+        The counter changes whenever the document is marked modified. A
+        document parsed again gets a new Document object, so callers should
+        compare the object as well as the counter.
+        
+        Args:
+            file_path: Path to the document file
+            
+        Returns:
+            Current revision number
+        """
+        return self._revisions.get(file_path, 0)
+    
+    def flush(self, file_path: str) -> None:
+        """
+        Drop a document from the cache so the next access parses it again.
+        
+        Args:
+            file_path: Path to the document file
+        """
+        self._documents.pop(file_path, None)
+        self._signatures.pop(file_path, None)
+        self._modified.discard(file_path)
+    
+    def _fresh_cached_document(self, file_path: str) -> Optional[Document]:
+        """
+        Return the cached document if it is an unmodified parse of the current file.
+        
+        Documents with unsaved changes or without a file signature are never
+        returned, so reopening still discards edits and re-reads the file.
+        """
+        document = self._documents.get(file_path)
+        if document is None or file_path in self._modified:
+            return None
+        signature = self._signatures.get(file_path)
+        if signature is None or signature != self._stat_signature(file_path):
+            return None
+        return document
+    
+    def _cache_document(self, file_path: str, document: Document) -> None:
+        """Cache a freshly opened document along with its file signature."""
+        self._documents[file_path] = document
+        self._signatures[file_path] = self._stat_signature(file_path)
+        self._modified.discard(file_path)
+    
+    def _path_lock(self, file_path: str) -> threading.Lock:
+        """Return the lock serializing cache checks and loads for one path."""
+        with self._locks_guard:
+            lock = self._locks.get(file_path)
+            if lock is None:
+                lock = self._locks[file_path] = threading.Lock()
+            return lock
+    
+    @staticmethod
+    def _stat_signature(file_path: str) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) for a file, or None if it cannot be stat'ed."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
     def close_document(self, file_path: str) -> OperationResponse:
         """
         Close a document and remove from cache.
@@ -174,7 +299,7 @@ class DocumentManager:
             OperationResponse with status and message
         """
         if file_path in self._documents:
-            del self._documents[file_path]
+            self.flush(file_path)
             return OperationResponse.success(f"Document closed: {file_path}")
         else:
             return OperationResponse.warning(f"Document not loaded: {file_path}")
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
+from typing_extensions import Literal, TypedDict
 from enum import Enum
 
 
@@ -36,7 +37,7 @@ class BorderWidth(Enum):
     THICK = "thick"
 
 
-@dataclass
+@dataclass(frozen=True)
 class TextFormat:
     """Text formatting properties for cells."""
     font_family: Optional[str] = None
@@ -65,7 +66,7 @@ class TextFormat:
         })
 
 
-@dataclass
+@dataclass(frozen=True)
 class CellAlignment:
     """Cell text alignment properties."""
     horizontal: Optional[HorizontalAlignment] = None
@@ -101,7 +102,7 @@ class CellAlignment:
         return cls(horizontal=horizontal, vertical=vertical)
 
 
-@dataclass
+@dataclass(frozen=True)
 class BorderProperties:
     """Properties for a single border (top, bottom, left, right)."""
     style: BorderStyle = BorderStyle.SOLID
@@ -138,7 +139,7 @@ class BorderProperties:
         return cls(style=style, width=width, color=color)
 
 
-@dataclass
+@dataclass(frozen=True)
 class CellBorders:
     """Border configuration for all sides of a cell."""
     top: Optional[BorderProperties] = None
@@ -169,7 +170,7 @@ class CellBorders:
         return cls(**borders)
 
 
-@dataclass
+@dataclass(frozen=True)
 class CellFormatting:
     """Complete formatting configuration for a cell."""
     text_format: Optional[TextFormat] = None
@@ -212,13 +213,48 @@ class CellFormatting:
         )
 
 
+# Dictionary shapes accepted by the formatting tools. They publish the allowed
+# keys in the tool schemas, and unknown keys are rejected instead of dropped.
+class TextFormatDict(TypedDict, total=False):
+    """Text formatting options given as a dictionary."""
+    __pydantic_config__ = {"extra": "forbid"}
+    font_family: str
+    font_size: int
+    font_color: str
+    bold: bool
+    italic: bool
+    underline: bool
+    strikethrough: bool
+
+
+class BorderDict(TypedDict, total=False):
+    """Properties of one cell border given as a dictionary."""
+    __pydantic_config__ = {"extra": "forbid"}
+    style: Literal["none", "solid", "dashed", "dotted", "double"]
+    width: Literal["thin", "medium", "thick"]
+    color: str
+
+
+class CellBordersDict(TypedDict, total=False):
+    """Cell borders given as a dictionary of side to border properties."""
+    __pydantic_config__ = {"extra": "forbid"}
+    top: BorderDict
+    bottom: BorderDict
+    left: BorderDict
+    right: BorderDict
+
+
 # Utility functions for color handling
 def hex_to_rgb(hex_color: str) -> tuple:
     """Convert hex color to RGB tuple."""
     hex_color = hex_color.lstrip('#')
     if len(hex_color) != 6:
         raise ValueError("Invalid hex color format")
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    # bytes.fromhex parses all three channels in one C call
+    rgb = bytes.fromhex(hex_color)
+    if len(rgb) != 3:
+        raise ValueError("Invalid hex color format")
+    return tuple(rgb)
 
 
 def rgb_to_hex(r: int, g: int, b: int) -> str:
@@ -229,12 +265,9 @@ def rgb_to_hex(r: int, g: int, b: int) -> str:
 def validate_color(color: str) -> bool:
     """Validate if color string is a valid hex color."""
     try:
-        color = color.lstrip('#')
-        if len(color) != 6:
-            return False
-        int(color, 16)
+        hex_to_rgb(color)
         return True
-    except ValueError:
+    except (ValueError, AttributeError):
         return False
 
 
@@ -1,9 +1,15 @@
 """Data models for comprehensive table structure and style analysis."""
 
+import sys
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Set
 from enum import Enum
 
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.simpletypes import ST_HexColor, ST_HpsMeasure
+from docx.shared import RGBColor
+from lxml import etree
+
 
 class CellMergeType(Enum):
     """Types of cell merging."""
@@ -16,6 +22,11 @@ class CellMergeType(Enum):
 @dataclass
 class MergeInfo:
     """Information about cell merging."""
+    __slots__ = (
+        "merge_type", "start_row", "end_row", "start_col", "end_col",
+        "span_rows", "span_cols",
+    )
+    
     merge_type: CellMergeType
     start_row: int
     end_row: int
@@ -28,6 +39,15 @@ class MergeInfo:
 @dataclass
 class CellStyleAnalysis:
     """Comprehensive analysis of a single cell's styling."""
+    # One instance per grid cell, so drop the per-instance __dict__
+    __slots__ = (
+        "row_index", "column_index", "text_content", "is_empty", "merge_info",
+        "font_family", "font_size", "font_color", "is_bold", "is_italic",
+        "is_underlined", "is_strikethrough", "horizontal_alignment",
+        "vertical_alignment", "background_color", "top_border", "bottom_border",
+        "left_border", "right_border", "width", "height",
+    )
+    
     # Position information
     row_index: int
     column_index: int
@@ -125,6 +145,16 @@ class CellStyleAnalysis:
 @dataclass
 class TableStructureAnalysis:
     """Comprehensive analysis of table structure and styling."""
+    # analyze_all_tables builds one per table, so drop the per-instance __dict__
+    __slots__ = (
+        "table_index", "total_rows", "total_columns", "table_style_name",
+        "table_alignment", "table_width", "has_header_row", "header_row_index",
+        "header_cells", "cells", "merged_cells_count", "merge_regions",
+        "consistent_fonts", "consistent_alignment", "consistent_borders",
+        "unique_font_families", "unique_font_sizes", "unique_colors",
+        "unique_background_colors",
+    )
+    
     # Basic table information
     table_index: int
     total_rows: int
@@ -210,6 +240,8 @@ class TableStructureAnalysis:
 @dataclass
 class TableAnalysisResult:
     """Result of comprehensive table analysis."""
+    __slots__ = ("file_path", "total_tables", "analysis_timestamp", "tables")
+    
     file_path: str
     total_tables: int
     analysis_timestamp: str
@@ -229,51 +261,64 @@ class TableAnalysisResult:
 
 # Helper functions for analysis
 def analyze_cell_merge(cell, row_idx: int, col_idx: int) -> Optional[MergeInfo]:
-    """Analyze if a cell is part of a merge and return merge information."""
+    """
+    Analyze if a cell is part of a merge and return merge information.
+    
+    Only cells covering more than one grid position are reported; a lone
+    vMerge="restart" with nothing continuing below it is not a merge.
+    """
     try:
-        # Check if cell is merged
-        if hasattr(cell, '_element'):
-            tc_element = cell._element
-            
-            # Check for gridSpan (horizontal merge)
-            grid_span = tc_element.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}gridSpan')
-            
-            # Check for vMerge (vertical merge)
-            tc_pr = tc_element.find('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}tcPr')
-            v_merge = None
-            if tc_pr is not None:
-                v_merge_elem = tc_pr.find('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}vMerge')
-                if v_merge_elem is not None:
-                    v_merge = v_merge_elem.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val')
-            
-            # Determine merge type and span
-            span_cols = int(grid_span) if grid_span else 1
-            span_rows = 1  # This would need more complex logic to determine vertical span
+        tc = cell._tc
+        
+        # Horizontal span comes from w:tcPr/w:gridSpan
+        span_cols = tc.grid_span
+        
+        # Vertical span: the rows from the restart cell down to the last
+        # vMerge="continue" cell below it
+        start_row = row_idx
+        span_rows = 1
+        if tc.vMerge is not None:
+            start_row = tc.top
+            span_rows = tc.bottom - start_row
+        
+        if span_cols > 1 or span_rows > 1:
+            if span_cols > 1 and span_rows > 1:
+                merge_type = CellMergeType.BOTH
+            elif span_cols > 1:
+                merge_type = CellMergeType.HORIZONTAL
+            else:
+                merge_type = CellMergeType.VERTICAL
             
-            if span_cols > 1 or v_merge is not None:
-                merge_type = CellMergeType.NONE
-                if span_cols > 1 and v_merge is not None:
-                    merge_type = CellMergeType.BOTH
-                elif span_cols > 1:
-                    merge_type = CellMergeType.HORIZONTAL
-                elif v_merge is not None:
-                    merge_type = CellMergeType.VERTICAL
-                
-                return MergeInfo(
-                    merge_type=merge_type,
-                    start_row=row_idx,
-                    end_row=row_idx + span_rows - 1,
-                    start_col=col_idx,
-                    end_col=col_idx + span_cols - 1,
-                    span_rows=span_rows,
-                    span_cols=span_cols
-                )
+            return MergeInfo(
+                merge_type=merge_type,
+                start_row=start_row,
+                end_row=start_row + span_rows - 1,
+                start_col=col_idx,
+                end_col=col_idx + span_cols - 1,
+                span_rows=span_rows,
+                span_cols=span_cols
+            )
     except Exception:
         pass
     
     return None
 
 
+_H_ALIGN_NAMES = {
+    0: "left",
+    1: "center",
+    2: "right",
+    3: "justify"
+}
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Return the interned copy of an attribute string so equal styles share one object."""
+    # lxml hands out a new str on every attribute read; detailed analyses keep
+    # one per cell, and the same few fonts and colors recur across all of them
+    return sys.intern(value) if value else value
+
+
 def extract_cell_formatting(cell) -> Dict[str, Any]:
     """Extract comprehensive formatting information from a cell."""
     formatting = {
@@ -302,24 +347,18 @@ def extract_cell_formatting(cell) -> Dict[str, Any]:
             
             # Paragraph alignment
             if paragraph.alignment is not None:
-                alignment_map = {
-                    0: "left",
-                    1: "center", 
-                    2: "right",
-                    3: "justify"
-                }
-                formatting["horizontal_alignment"] = alignment_map.get(paragraph.alignment)
+                formatting["horizontal_alignment"] = _H_ALIGN_NAMES.get(paragraph.alignment)
             
             # Run formatting (text properties)
             if paragraph.runs:
                 run = paragraph.runs[0]
                 
                 if run.font.name:
-                    formatting["font_family"] = run.font.name
+                    formatting["font_family"] = _intern(run.font.name)
                 if run.font.size:
                     formatting["font_size"] = run.font.size.pt
                 if run.font.color and run.font.color.rgb:
-                    formatting["font_color"] = str(run.font.color.rgb)
+                    formatting["font_color"] = _intern(str(run.font.color.rgb))
                     
                 formatting["is_bold"] = run.bold or False
                 formatting["is_italic"] = run.italic or False
@@ -336,13 +375,13 @@ def extract_cell_formatting(cell) -> Dict[str, Any]:
                 if shd is not None:
                     fill = shd.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}fill')
                     if fill:
-                        formatting["background_color"] = fill
+                        formatting["background_color"] = _intern(fill)
                 
                 # Vertical alignment
                 v_align = tc_pr.find('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}vAlign')
                 if v_align is not None:
                     val = v_align.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val')
-                    formatting["vertical_alignment"] = val
+                    formatting["vertical_alignment"] = _intern(val)
                 
                 # Borders
                 tc_borders = tc_pr.find('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}tcBorders')
@@ -360,9 +399,9 @@ def extract_cell_formatting(cell) -> Dict[str, Any]:
                         
                         if border_elem is not None:
                             border_info = {
-                                "style": border_elem.get(f'{{{ns}}}val'),
-                                "width": border_elem.get(f'{{{ns}}}sz'),
-                                "color": border_elem.get(f'{{{ns}}}color')
+                                "style": _intern(border_elem.get(f'{{{ns}}}val')),
+                                "width": _intern(border_elem.get(f'{{{ns}}}sz')),
+                                "color": _intern(border_elem.get(f'{{{ns}}}color'))
                             }
                             formatting["borders"][border_side] = border_info
                             
@@ -371,3 +410,85 @@ def extract_cell_formatting(cell) -> Dict[str, Any]:
         pass
     
     return formatting
+
+
+_W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+# Cells that hold their own content; a vMerge="continue" cell is covered by
+# the cell above it, exactly as row.cells resolves it
+_XP_CONTENT_CELLS = 'w:tr/w:tc[not(w:tcPr/w:vMerge) or w:tcPr/w:vMerge/@w:val="restart"]'
+
+# Everything extract_cell_formatting reads for the style summary, for every
+# content cell of a table, in a single compiled XPath evaluation
+_XP_TABLE_STYLE_VALUES = etree.XPath(
+    ' | '.join(_XP_CONTENT_CELLS + path for path in (
+        '/w:p[1]/w:pPr/w:jc/@w:val',
+        '/w:p[1]/w:r[1]/w:rPr/w:rFonts/@w:ascii',
+        '/w:p[1]/w:r[1]/w:rPr/w:sz/@w:val',
+        '/w:p[1]/w:r[1]/w:rPr/w:color/@w:val',
+        '/w:tcPr/w:shd/@w:fill',
+        '/w:tcPr/w:tcBorders/w:top/@w:val',
+        '/w:tcPr/w:tcBorders/w:bottom/@w:val',
+        '/w:tcPr/w:tcBorders/w:left/@w:val',
+        '/w:tcPr/w:tcBorders/w:right/@w:val',
+    )),
+    namespaces={'w': _W_NS}
+)
+
+_TAG_JC = f'{{{_W_NS}}}jc'
+_TAG_RFONTS = f'{{{_W_NS}}}rFonts'
+_TAG_SZ = f'{{{_W_NS}}}sz'
+_TAG_COLOR = f'{{{_W_NS}}}color'
+_TAG_SHD = f'{{{_W_NS}}}shd'
+_BORDER_TAGS = frozenset(f'{{{_W_NS}}}{side}' for side in ('top', 'bottom', 'left', 'right'))
+
+
+def extract_table_style_values(tbl) -> Dict[str, Set[Any]]:
+    """
+    Collect the distinct style values of a table's cells from its <w:tbl> element.
+    
+    Reads the same properties as extract_cell_formatting (first paragraph,
+    first run and cell properties of every cell) but in one XPath pass over
+    the table instead of one set of python-docx accessors per cell.
+    
+    Returns:
+        Sets keyed font_families, font_sizes, colors, background_colors,
+        alignments and border_styles
+    """
+    values: Dict[str, Set[Any]] = {
+        "font_families": set(),
+        "font_sizes": set(),
+        "colors": set(),
+        "background_colors": set(),
+        "alignments": set(),
+        "border_styles": set(),
+    }
+    
+    for value in _XP_TABLE_STYLE_VALUES(tbl):
+        if not value:
+            continue
+        tag = value.getparent().tag
+        try:
+            if tag == _TAG_RFONTS:
+                values["font_families"].add(_intern(str(value)))
+            elif tag == _TAG_SZ:
+                size = ST_HpsMeasure.convert_from_xml(value)
+                if size:
+                    values["font_sizes"].add(size.pt)
+            elif tag == _TAG_COLOR:
+                rgb = ST_HexColor.convert_from_xml(value)
+                if isinstance(rgb, RGBColor):
+                    values["colors"].add(_intern(str(rgb)))
+            elif tag == _TAG_SHD:
+                values["background_colors"].add(_intern(str(value)))
+            elif tag == _TAG_JC:
+                alignment = _H_ALIGN_NAMES.get(WD_ALIGN_PARAGRAPH.from_xml(value))
+                if alignment:
+                    values["alignments"].add(alignment)
+            elif tag in _BORDER_TAGS:
+                values["border_styles"].add(_intern(str(value)))
+        except ValueError:
+            # Malformed values are skipped, as extract_cell_formatting would
+            continue
+    
+    return values
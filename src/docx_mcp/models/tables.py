@@ -3,6 +3,8 @@
 from dataclasses import dataclass
 from typing import List, Optional, Any, Dict
 
+from .formatting import TextFormat
+
 
 @dataclass
 class TableInfo:
@@ -23,9 +25,51 @@ class CellPosition:
     column_index: int
 
 
+@dataclass
+class CellUpdate:
+    """A single cell write in a batched cell update."""
+    row_index: int
+    column_index: int
+    value: str
+    text_format: Optional[TextFormat] = None
+    alignment: Optional[Dict[str, str]] = None  # {"horizontal": ..., "vertical": ...}
+    background_color: Optional[str] = None
+    preserve_existing_format: bool = True
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CellUpdate":
+        """Create from the flat keys accepted by the set_cell_value tool."""
+        text_format = None
+        if any(data.get(k) is not None for k in TextFormat.__dataclass_fields__):
+            text_format = TextFormat.from_dict(data)
+        
+        alignment = None
+        if data.get("horizontal_alignment") or data.get("vertical_alignment"):
+            alignment = {}
+            if data.get("horizontal_alignment"):
+                alignment["horizontal"] = data["horizontal_alignment"]
+            if data.get("vertical_alignment"):
+                alignment["vertical"] = data["vertical_alignment"]
+        
+        return cls(
+            row_index=data["row_index"],
+            column_index=data["column_index"],
+            value=data["value"],
+            text_format=text_format,
+            alignment=alignment,
+            background_color=data.get("background_color"),
+            preserve_existing_format=data.get("preserve_existing_format", True)
+        )
+
+
 @dataclass
 class TableSearchMatch:
     """A single search match in a table cell."""
+    __slots__ = (
+        "table_index", "row_index", "column_index", "cell_value",
+        "match_text", "match_start", "match_end",
+    )
+    
     table_index: int
     row_index: int
     column_index: int
@@ -33,11 +77,28 @@ class TableSearchMatch:
     match_text: str
     match_start: int  # Start position of match within cell
     match_end: int    # End position of match within cell
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary format."""
+        return {
+            "table_index": self.table_index,
+            "row_index": self.row_index,
+            "column_index": self.column_index,
+            "cell_value": self.cell_value,
+            "match_text": self.match_text,
+            "match_start": self.match_start,
+            "match_end": self.match_end
+        }
 
 
 @dataclass
 class TableSearchResult:
     """Result of a table search operation."""
+    __slots__ = (
+        "query", "search_mode", "case_sensitive", "matches",
+        "total_matches", "tables_searched", "summary",
+    )
+    
     query: str
     search_mode: str  # "exact", "contains", "regex"
     case_sensitive: bool
@@ -52,18 +113,7 @@ class TableSearchResult:
             "query": self.query,
             "search_mode": self.search_mode,
             "case_sensitive": self.case_sensitive,
-            "matches": [
-                {
-                    "table_index": m.table_index,
-                    "row_index": m.row_index,
-                    "column_index": m.column_index,
-                    "cell_value": m.cell_value,
-                    "match_text": m.match_text,
-                    "match_start": m.match_start,
-                    "match_end": m.match_end
-                }
-                for m in self.matches
-            ],
+            "matches": [m.to_dict() for m in self.matches],
             "total_matches": self.total_matches,
             "tables_searched": self.tables_searched,
             "summary": self.summary
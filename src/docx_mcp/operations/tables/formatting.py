@@ -1,6 +1,6 @@
 """Table and cell formatting operations."""
 
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, Collection
 from docx.shared import RGBColor, Pt
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 from docx.enum.table import WD_TABLE_ALIGNMENT
@@ -10,6 +10,7 @@ from ...models.responses import OperationResponse
 from ...models.formatting import (
     TextFormat, CellAlignment, CellBorders, CellFormatting,
     HorizontalAlignment, VerticalAlignment, BorderStyle, BorderWidth,
+    TextFormatDict, BorderDict, CellBordersDict,
     hex_to_rgb, validate_color
 )
 from ...utils.exceptions import (
@@ -19,6 +20,39 @@ from ...utils.exceptions import (
 from ...utils.validation import validate_table_index, validate_cell_position
 
 
+_PARAGRAPH_ALIGNMENTS = {
+    HorizontalAlignment.LEFT: WD_PARAGRAPH_ALIGNMENT.LEFT,
+    HorizontalAlignment.CENTER: WD_PARAGRAPH_ALIGNMENT.CENTER,
+    HorizontalAlignment.RIGHT: WD_PARAGRAPH_ALIGNMENT.RIGHT,
+    HorizontalAlignment.JUSTIFY: WD_PARAGRAPH_ALIGNMENT.JUSTIFY
+}
+
+_VERTICAL_ALIGNMENTS = {
+    VerticalAlignment.TOP: "top",
+    VerticalAlignment.MIDDLE: "center",
+    VerticalAlignment.BOTTOM: "bottom"
+}
+
+
+def _unknown_keys(data: Dict[str, Any], allowed: Collection[str]) -> str:
+    """Return the keys of data that are not allowed, comma-separated."""
+    return ", ".join(sorted(str(key) for key in data if key not in allowed))
+
+
+def _check_borders_dict(borders: Dict[str, Any]) -> Optional[str]:
+    """Return why a borders dictionary is invalid, or None if it is valid."""
+    unknown = _unknown_keys(borders, CellBordersDict.__optional_keys__)
+    if unknown:
+        return f"Unknown border sides: {unknown}. Valid sides: top, bottom, left, right"
+    for side, border in borders.items():
+        if not isinstance(border, dict):
+            return f"Border '{side}' must be a dictionary"
+        unknown = _unknown_keys(border, BorderDict.__optional_keys__)
+        if unknown:
+            return f"Unknown properties for border '{side}': {unknown}. Valid properties: style, width, color"
+    return None
+
+
 class TableFormattingOperations:
     """Handles table and cell formatting operations."""
     
@@ -48,7 +82,7 @@ class TableFormattingOperations:
             OperationResponse indicating success or failure
         """
         try:
-            document = self.document_manager.get_or_load_document(file_path)
+            document = self.document_manager.get_cached_or_load(file_path)
             
             # Validate parameters
             validate_table_index(table_index, len(document.tables))
@@ -57,8 +91,14 @@ class TableFormattingOperations:
             
             # Convert dict to TextFormat if needed
             if isinstance(text_format, dict):
+                unknown = _unknown_keys(text_format, TextFormatDict.__optional_keys__)
+                if unknown:
+                    return OperationResponse.error(f"Unknown text format options: {unknown}")
                 text_format = TextFormat.from_dict(text_format)
             
+            if not text_format.to_dict():
+                return OperationResponse.error("No text formatting provided")
+            
             # Get the cell
             cell = table.rows[row_index].cells[column_index]
             
@@ -72,6 +112,8 @@ class TableFormattingOperations:
                     run = paragraph.runs[0] if paragraph.runs else paragraph.add_run()
                     self._apply_text_formatting(run, text_format)
             
+            self.document_manager.mark_modified(file_path)
+            
             return OperationResponse.success(
                 f"Text formatting applied to cell [{row_index}, {column_index}]",
                 {
@@ -107,7 +149,7 @@ class TableFormattingOperations:
             OperationResponse indicating success or failure
         """
         try:
-            document = self.document_manager.get_or_load_document(file_path)
+            document = self.document_manager.get_cached_or_load(file_path)
             
             # Validate parameters
             validate_table_index(table_index, len(document.tables))
@@ -131,6 +173,8 @@ class TableFormattingOperations:
             if alignment.vertical:
                 self._set_cell_vertical_alignment(cell, alignment.vertical)
             
+            self.document_manager.mark_modified(file_path)
+            
             return OperationResponse.success(
                 f"Alignment applied to cell [{row_index}, {column_index}]",
                 {
@@ -166,7 +210,7 @@ class TableFormattingOperations:
             OperationResponse indicating success or failure
         """
         try:
-            document = self.document_manager.get_or_load_document(file_path)
+            document = self.document_manager.get_cached_or_load(file_path)
             
             # Validate parameters
             validate_table_index(table_index, len(document.tables))
@@ -184,6 +228,8 @@ class TableFormattingOperations:
             # Set background color using shading
             self._set_cell_background_color(cell, color)
             
+            self.document_manager.mark_modified(file_path)
+            
             return OperationResponse.success(
                 f"Background color applied to cell [{row_index}, {column_index}]",
                 {
@@ -219,7 +265,7 @@ class TableFormattingOperations:
             OperationResponse indicating success or failure
         """
         try:
-            document = self.document_manager.get_or_load_document(file_path)
+            document = self.document_manager.get_cached_or_load(file_path)
             
             # Validate parameters
             validate_table_index(table_index, len(document.tables))
@@ -228,14 +274,22 @@ class TableFormattingOperations:
             
             # Convert dict to CellBorders if needed
             if isinstance(borders, dict):
+                error = _check_borders_dict(borders)
+                if error:
+                    return OperationResponse.error(error)
                 borders = CellBorders.from_dict(borders)
             
+            if not borders.to_dict():
+                return OperationResponse.error("No borders provided")
+            
             # Get the cell
             cell = table.rows[row_index].cells[column_index]
             
             # Apply borders
             self._set_cell_borders(cell, borders)
             
+            self.document_manager.mark_modified(file_path)
+            
             return OperationResponse.success(
                 f"Borders applied to cell [{row_index}, {column_index}]",
                 {
@@ -338,10 +392,11 @@ class TableFormattingOperations:
             run.font.size = Pt(text_format.font_size)
         
         if text_format.font_color:
-            color = text_format.font_color.lstrip('#')
-            if validate_color(color):
-                r, g, b = hex_to_rgb(color)
+            try:
+                r, g, b = hex_to_rgb(text_format.font_color)
                 run.font.color.rgb = RGBColor(r, g, b)
+            except ValueError:
+                pass  # Ignore invalid colors
         
         if text_format.bold is not None:
             run.font.bold = text_format.bold
@@ -363,13 +418,7 @@ class TableFormattingOperations:
 
     def _get_paragraph_alignment(self, alignment: HorizontalAlignment):
         """Convert HorizontalAlignment to WD_PARAGRAPH_ALIGNMENT."""
-        alignment_map = {
-            HorizontalAlignment.LEFT: WD_PARAGRAPH_ALIGNMENT.LEFT,
-            HorizontalAlignment.CENTER: WD_PARAGRAPH_ALIGNMENT.CENTER,
-            HorizontalAlignment.RIGHT: WD_PARAGRAPH_ALIGNMENT.RIGHT,
-            HorizontalAlignment.JUSTIFY: WD_PARAGRAPH_ALIGNMENT.JUSTIFY
-        }
-        return alignment_map.get(alignment, WD_PARAGRAPH_ALIGNMENT.LEFT)
+        return _PARAGRAPH_ALIGNMENTS.get(alignment, WD_PARAGRAPH_ALIGNMENT.LEFT)
 
     def _set_cell_vertical_alignment(self, cell, alignment: VerticalAlignment):
         """Set vertical alignment for a cell."""
@@ -383,12 +432,7 @@ class TableFormattingOperations:
         
         # Add new vAlign
         vAlign = OxmlElement('w:vAlign')
-        alignment_map = {
-            VerticalAlignment.TOP: "top",
-            VerticalAlignment.MIDDLE: "center", 
-            VerticalAlignment.BOTTOM: "bottom"
-        }
-        vAlign.set(qn('w:val'), alignment_map.get(alignment, "top"))
+        vAlign.set(qn('w:val'), _VERTICAL_ALIGNMENTS.get(alignment, "top"))
         tcPr.append(vAlign)
 
     def _set_cell_background_color(self, cell, color: str):
@@ -1,18 +1,41 @@
 """Table operations for Word documents."""
 
+import csv
+import io
 import re
-from typing import List, Optional, Dict, Any, Union
+import weakref
+from copy import copy, deepcopy
+from dataclasses import replace
+from functools import lru_cache
+from itertools import islice
+from typing import List, Optional, Dict, Any, Union, Callable, Tuple, Iterator
 from docx import Document
 from docx.table import Table, _Cell
 from docx.shared import Inches, Pt, RGBColor
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
 from docx.oxml.shared import qn, OxmlElement
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:  # pragma: no cover - optional dependency
+    re2 = None
+
+
 from ...models.responses import OperationResponse
-from ...models.tables import TableInfo, CellPosition, SearchResult, TableData, TableSearchMatch, TableSearchResult
+from ...models.tables import (
+    TableInfo, CellPosition, SearchResult, TableData, TableSearchMatch, TableSearchResult, CellUpdate
+)
 from ...models.table_analysis import (
     TableStructureAnalysis, CellStyleAnalysis, TableAnalysisResult, MergeInfo,
-    CellMergeType, analyze_cell_merge, extract_cell_formatting
+    CellMergeType, analyze_cell_merge, extract_cell_formatting,
+    extract_table_style_values
 )
 from ...models.formatting import TextFormat, CellAlignment
 from ...utils.exceptions import (
@@ -33,6 +56,439 @@ from ...core.document_manager import DocumentManager
 from .formatting import TableFormattingOperations
 
 
+# Minimal valid table cell: a <w:tc> must contain at least one block element
+_TC_XML = '<w:tc %s><w:p/></w:tc>' % nsdecls('w')
+
+# Pre-built elements; each use takes a copy.copy, which clones in C instead of
+# going through the element factory (or the XML parser) again
+_SOLID_SHD_TEMPLATE = parse_xml('<w:shd %s w:val="clear" w:color="auto"/>' % nsdecls('w'))
+_SHD_TEMPLATE = OxmlElement('w:shd')
+_VALIGN_TEMPLATE = OxmlElement('w:vAlign')
+
+_QN_VALIGN = qn('w:vAlign')
+_QN_SHD = qn('w:shd')
+_QN_VAL = qn('w:val')
+_QN_TCPR = qn('w:tcPr')
+_QN_P = qn('w:p')
+_QN_PPR = qn('w:pPr')
+_QN_R = qn('w:r')
+_QN_RPR = qn('w:rPr')
+_QN_FILL = qn('w:fill')
+_QN_CNFSTYLE = qn('w:cnfStyle')
+
+# tcPr children describing a cell's place in the grid rather than its style
+_TC_LAYOUT_TAGS = frozenset(qn(tag) for tag in ('w:tcW', 'w:gridSpan', 'w:hMerge', 'w:vMerge'))
+
+_H_ALIGN_MAP = {
+    'left': WD_ALIGN_PARAGRAPH.LEFT,
+    'center': WD_ALIGN_PARAGRAPH.CENTER,
+    'right': WD_ALIGN_PARAGRAPH.RIGHT,
+    'justify': WD_ALIGN_PARAGRAPH.JUSTIFY,
+}
+
+_V_ALIGN_MAP = {
+    'top': 'top',
+    'middle': 'center',
+    'bottom': 'bottom',
+}
+
+# (flat key, side, attribute) for every border field get_cell_value reports
+_BORDER_KEYS = tuple(
+    (f'{side}_{attr}', side, attr)
+    for side in ('top', 'bottom', 'left', 'right')
+    for attr in ('style', 'width', 'color')
+)
+
+_LITERAL_CHAR_RE = re.compile(r"[A-Za-z0-9 _-]")
+
+
+# Bulk writes tend to reuse a handful of colors, so parsed colors are
+# memoized; both results are immutable and safe to share across cells.
+@lru_cache(maxsize=256)
+def _normalize_hex_color(color: str) -> Optional[str]:
+    """Return an RRGGBB hex string (with optional leading '#') as six uppercase digits, or None."""
+    try:
+        hex_digits = color.lstrip('#')
+        if len(hex_digits) != 6:
+            return None
+        # One C-level parse for all three channels; unlike int(..., 16) it
+        # rejects signs, underscores and a 0x prefix.
+        rgb = bytes.fromhex(hex_digits)
+    except (ValueError, AttributeError, TypeError):
+        return None
+    if len(rgb) != 3:
+        return None
+    return rgb.hex().upper()
+
+
+@lru_cache(maxsize=256)
+def _hex_to_rgbcolor(color: str) -> Optional[RGBColor]:
+    """Parse an RRGGBB hex string (with optional leading '#') into an RGBColor, or None."""
+    hex_digits = _normalize_hex_color(color)
+    if hex_digits is None:
+        return None
+    return RGBColor.from_string(hex_digits)
+
+
+def _tc_at_grid_column(tcs, column_index: int):
+    """Return the <w:tc> covering a grid column of a row, or None if the row is shorter."""
+    grid_col = 0
+    for tc in tcs:
+        grid_col += tc.grid_span
+        if column_index < grid_col:
+            return tc
+    return None
+
+
+def _cell_holds_text(cell: _Cell, text: str) -> bool:
+    """Return True if the cell is a single paragraph of at most one run reading exactly text."""
+    content = [child for child in cell._tc if child.tag != _QN_TCPR]
+    if len(content) != 1 or content[0].tag != _QN_P:
+        return False
+    runs = [child for child in content[0] if child.tag != _QN_PPR]
+    if not runs:
+        return text == ""
+    return len(runs) == 1 and runs[0].tag == _QN_R and runs[0].text == text
+
+
+def _cached_cell_text(cell: _Cell, cache: Dict[Any, str]) -> str:
+    """Return cell.text, walking each <w:tc> only once per cache.
+
+    Merged regions repeat the same <w:tc> across row.cells, so keying on the
+    element shares one text walk between every grid position it covers.
+    """
+    tc = cell._tc
+    text = cache.get(tc)
+    if text is None:
+        text = cache[tc] = _tc_text(tc)
+    return text
+
+
+def _tc_text(tc) -> str:
+    """Return the text of a <w:tc> exactly as _Cell.text would, without the proxies."""
+    return "\n".join(p.text for p in tc.p_lst)
+
+
+def _first_row_texts(table: Table) -> Optional[List[str]]:
+    """Return the cell texts of a table's first row laid out like row.cells, or None if it has no rows."""
+    tr = next(iter(table._tbl.tr_lst), None)
+    if tr is None:
+        return None
+    texts: List[str] = []
+    for tc in tr.tc_lst:
+        texts.extend([_tc_text(tc)] * tc.grid_span)
+    return texts
+
+
+def _table_text_rows(table: Table) -> List[List[str]]:
+    """Return the text of every row in table, laid out like row.cells.
+
+    Works on the <w:tr>/<w:tc> elements directly, skipping the _Row/_Cell/
+    Paragraph proxies. Matching row.cells, a <w:tc> repeats once per grid
+    column it spans, and a vMerge="continue" cell reads the text of the cell
+    above it.
+    """
+    rows = []
+    above: Dict[int, str] = {}
+    for tr in table._tbl.tr_lst:
+        row: List[str] = []
+        current: Dict[int, str] = {}
+        grid_col = tr.grid_before
+        for tc in tr.tc_lst:
+            span = tc.grid_span
+            text = above.get(grid_col) if tc.vMerge == "continue" else None
+            if text is None:
+                text = _tc_text(tc)
+            current[grid_col] = text
+            row.extend([text] * span)
+            grid_col += span
+        rows.append(row)
+        above = current
+    return rows
+
+
+def _table_cell_grid(table: Table) -> List[List[_Cell]]:
+    """Return the cells of every row in table, laid out like row.cells.
+
+    One _Cell is made per <w:tc> and repeated for each grid column it spans.
+    A vMerge="continue" cell resolves to the cell above it through a map of
+    the previous row's grid columns; row.cells instead calls _tc_above for
+    every continuation cell, which rescans the table's row list each time.
+    """
+    rows = []
+    above: Dict[int, _Cell] = {}
+    for tr in table._tbl.tr_lst:
+        row: List[_Cell] = []
+        current: Dict[int, _Cell] = {}
+        grid_col = tr.grid_before
+        for tc in tr.tc_lst:
+            span = tc.grid_span
+            cell = above.get(grid_col) if tc.vMerge == "continue" else None
+            if cell is None:
+                cell = _Cell(tc, table)
+            current[grid_col] = cell
+            row.extend([cell] * span)
+            grid_col += span
+        rows.append(row)
+        above = current
+    return rows
+
+
+def _find_child(parent, tag: str):
+    """Return the first direct child of parent with the given qualified tag, or None."""
+    # iterchildren filters by tag in C; find() goes through ElementPath first
+    return next(parent.iterchildren(tag), None)
+
+
+def _apply_valign(tc_pr, val: str) -> None:
+    """Replace the vertical alignment of a cell's tcPr with the given w:val."""
+    existing = _find_child(tc_pr, _QN_VALIGN)
+    if existing is not None:
+        tc_pr.remove(existing)
+    valign = copy(_VALIGN_TEMPLATE)
+    valign.set(_QN_VAL, val)
+    tc_pr.append(valign)
+
+
+def _apply_shading(tc_pr, hex_color: str) -> None:
+    """Replace the shading of a cell's tcPr with a solid fill of hex_color."""
+    existing = _find_child(tc_pr, _QN_SHD)
+    if existing is not None:
+        tc_pr.remove(existing)
+    shading = copy(_SOLID_SHD_TEMPLATE)
+    shading.set(_QN_FILL, hex_color)
+    tc_pr.append(shading)
+
+
+def _replace_tc_pr(target_tc, source_tc_pr) -> None:
+    """
+    Give target_tc a copy of source_tc_pr, keeping target_tc's own layout.
+    
+    Width, gridSpan and merge markers stay those of the target cell; every
+    other cell property is taken from the source.
+    """
+    clone = copy(source_tc_pr)
+    for child in [child for child in clone if child.tag in _TC_LAYOUT_TAGS]:
+        clone.remove(child)
+    
+    target_tc_pr = target_tc.tcPr
+    if target_tc_pr is not None:
+        layout = [child for child in target_tc_pr if child.tag in _TC_LAYOUT_TAGS]
+        # Layout properties follow an optional cnfStyle in schema order
+        at = 1 if len(clone) and clone[0].tag == _QN_CNFSTYLE else 0
+        clone[at:at] = layout
+        target_tc.remove(target_tc_pr)
+    target_tc.insert(0, clone)
+
+
+def _is_overlap_free(needle: str) -> bool:
+    """Return True if no proper prefix of the needle is also a suffix of it."""
+    return all(needle[:k] != needle[-k:] for k in range(1, len(needle)))
+
+
+@lru_cache(maxsize=128)
+def _compile_literal(needle: str) -> re.Pattern:
+    """
+    Compile a pattern whose match starts are every occurrence of needle.
+    
+    Contains search reports overlapping hits ("aa" occurs twice in "aaa"),
+    while finditer only yields non-overlapping matches. Needles that cannot
+    overlap themselves use the plain escaped literal; the rest are wrapped in
+    a zero-width lookahead so the engine retries from the next character.
+    """
+    escaped = re.escape(needle)
+    if _is_overlap_free(needle):
+        return re.compile(escaped)
+    return re.compile(f"(?={escaped})")
+
+
+@lru_cache(maxsize=128)
+def _compile_re2(query: str, case_sensitive: bool):
+    """Compile query with RE2, or return None if RE2 does not support it."""
+    options = re2.Options()
+    options.case_sensitive = case_sensitive
+    # Unsupported patterns are expected here; keep RE2 from logging them
+    options.log_errors = False
+    try:
+        return re2.compile(query, options)
+    except re2.error:
+        # Backreferences, lookaround and the like have no RE2 equivalent
+        return None
+
+
+def _compile_search_pattern(query: str, case_sensitive: bool) -> re.Pattern:
+    """
+    Compile a user search regex, raising re.error if it is invalid.
+    
+    re.compile keeps its own cache of recently compiled patterns keyed on
+    (pattern, flags), so repeated searches for the same query reuse the
+    compiled program without a cache of our own.
+    
+    When the optional google-re2 package is installed, patterns it supports
+    run on RE2 instead. RE2 matches in linear time, so a pattern that would
+    backtrack catastrophically in re cannot stall a search over many cells.
+    The query is still validated with re so invalid patterns report the
+    same re.error either way. RE2's \\d, \\w, \\s and \\b only cover ASCII,
+    so the matcher runs patterns using them on non-ASCII cells with re
+    (see _uses_unicode_classes).
+    """
+    compiled = re.compile(query, 0 if case_sensitive else re.IGNORECASE)
+    if re2 is not None:
+        return _compile_re2(query, case_sensitive) or compiled
+    return compiled
+
+
+def _uses_unicode_classes(pattern: str) -> bool:
+    """
+    Return whether a regex uses \\d, \\w, \\s or \\b (or their negations).
+    
+    re gives these classes their Unicode meaning while RE2 limits them to
+    ASCII. Cell text cannot hold the ASCII control characters that re's \\s
+    adds (XML does not allow them), so both engines agree on ASCII text.
+    """
+    escaped = False
+    for ch in pattern:
+        if escaped:
+            if ch in "dDwWsSbB":
+                return True
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+    return False
+
+
+def _required_literal(pattern: str) -> Optional[str]:
+    """
+    Return the longest literal text every match of the regex must contain, if any.
+    
+    Only runs of letters, digits, spaces, underscores and hyphens outside
+    groups, character classes and {m,n} repeats are considered, and escaped
+    characters end a run. A character followed by a quantifier is dropped since it may
+    repeat zero times, and patterns containing alternation or inline flag
+    groups get no literal because no run is guaranteed to be required. Nor
+    do patterns with escapes that spell out a character (\\x41, \\101,
+    \\N{...}) or refer back to a group, since their text is not literal.
+    """
+    if "|" in pattern or "(?" in pattern:
+        return None
+    
+    best = ""
+    run = []
+    depth = 0
+    in_class = False
+    # 2 right after "[", 1 right after "[^": a "]" here is a class member
+    class_start = 0
+    in_repeat = False
+    escaped = False
+    for ch in pattern + "\0":
+        if escaped:
+            if ch in "xuUN0123456789":
+                return None
+            escaped = False
+            continue
+        if depth == 0 and not in_class and not in_repeat and _LITERAL_CHAR_RE.match(ch):
+            run.append(ch)
+            continue
+        # The run ends here; a quantifier makes its last character optional
+        if ch in "?*{" and run:
+            run.pop()
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+        if ch == "\\":
+            escaped = True
+            class_start = 0
+        elif in_class:
+            if ch == "^" and class_start == 2:
+                class_start = 1
+            elif ch == "]" and not class_start:
+                in_class = False
+            else:
+                class_start = 0
+        elif in_repeat:
+            if ch == "}":
+                in_repeat = False
+        elif ch == "{":
+            in_repeat = True
+        elif ch == "[":
+            in_class = True
+            class_start = 2
+        elif ch == "(":
+            depth += 1
+        elif ch == ")" and depth:
+            depth -= 1
+    return best or None
+
+
+def _fold_ascii_pattern(pattern: str) -> Optional[str]:
+    """
+    Lowercase an ASCII regex so it can run without re.IGNORECASE on lowered text.
+    
+    Escaped characters keep their case (so \\D stays \\D). Returns None when
+    folding could change the meaning of the pattern: character classes
+    (ranges such as [A-z]), inline flag groups such as (?-i:...), and escapes
+    that spell out a literal character (\\x41, \\101, \\N{...}).
+    """
+    if not pattern.isascii() or "[" in pattern or "(?" in pattern:
+        return None
+    
+    folded = []
+    escaped = False
+    for ch in pattern:
+        if escaped:
+            if ch in "xuUN01234567":
+                return None
+            folded.append(ch)
+            escaped = False
+        elif ch == "\\":
+            folded.append(ch)
+            escaped = True
+        else:
+            folded.append(ch.lower())
+    return "".join(folded)
+
+
+class _CellStylePlan:
+    """Default cell formatting resolved once for every cell it is applied to."""
+    __slots__ = (
+        "has_text_format", "font_family", "font_size", "rgb", "bold", "italic",
+        "underline", "h_align", "v_align", "fill",
+    )
+    
+    def __init__(
+        self,
+        text_format: Optional[TextFormat],
+        alignment: Optional[CellAlignment],
+        background_color: Optional[str]
+    ):
+        self.has_text_format = bool(text_format)
+        self.font_family = text_format.font_family if text_format else None
+        self.font_size = Pt(text_format.font_size) if text_format and text_format.font_size else None
+        self.rgb = (
+            _hex_to_rgbcolor(text_format.font_color)
+            if text_format and text_format.font_color else None
+        )
+        self.bold = text_format.bold if text_format else None
+        self.italic = text_format.italic if text_format else None
+        self.underline = text_format.underline if text_format else None
+        
+        self.h_align = None
+        self.v_align = None
+        if alignment:
+            if alignment.horizontal:
+                self.h_align = _H_ALIGN_MAP.get(alignment.horizontal.lower())
+            if alignment.vertical:
+                v_align = alignment.vertical.lower()
+                self.v_align = 'center' if v_align == 'middle' else v_align
+        
+        self.fill = _normalize_hex_color(background_color) if background_color else None
+    
+    def is_empty(self) -> bool:
+        """Return True if nothing resolved to a change, e.g. only an invalid color was given."""
+        return not (self.has_text_format or self.h_align is not None
+                    or self.v_align or self.fill is not None)
+
+
 class TableOperations:
     """Handles table operations in Word documents."""
     
@@ -45,6 +501,13 @@ class TableOperations:
         """
         self.document_manager = document_manager
         self.formatting = TableFormattingOperations(document_manager)
+        # file_path -> (weak reference to the document, its revision,
+        # {(table_index, lowered): cell text rows, and
+        #  ("joined", table_index, lowered): (joined cell texts, cell count)})
+        # for repeated reads and searches
+        self._table_text_cache: Dict[
+            str, Tuple[weakref.ref, int, Dict[tuple, Any]]
+        ] = {}
     
     def create_table(
         self,
@@ -84,7 +547,7 @@ class TableOperations:
                 return OperationResponse.error(f"Headers length ({len(headers)}) must match columns ({cols})")
             
             # Get document
-            document = self.document_manager.get_or_load_document(file_path)
+            document = self.document_manager.get_cached_or_load(file_path)
             
             # Create table
             table = None
@@ -110,11 +573,16 @@ class TableOperations:
             
             # Set headers if provided
             if headers:
+                # Resolve the header row's cells once; table.cell() rebuilds
+                # the cell grid of the whole table on every call
+                header_cells = table.rows[0].cells
                 for col_idx, header in enumerate(headers):
-                    table.cell(0, col_idx).text = sanitize_string(header)
+                    header_cells[col_idx].text = sanitize_string(header)
             
             table_index = len(document.tables) - 1
             
+            self.document_manager.mark_modified(file_path)
+            
             data = {
                 "table_index": table_index,
                 "rows": rows,
@@ -140,7 +608,7 @@ class TableOperations:
             OperationResponse with operation result
         """
         try:
-            document = self.document_manager.get_or_load_document(file_path)
+            document = self.document_manager.get_cached_or_load(file_path)
             
             validate_table_index(table_index, len(document.tables))
             
@@ -148,6 +616,8 @@ class TableOperations:
             table = document.tables[table_index]
             table._element.getparent().remove(table._element)
             
+            self.document_manager.mark_modified(file_path)
+            
             return OperationResponse.success(f"Table {table_index} deleted")
             
         except (InvalidTableIndexError, TableNotFoundError) as e:
@@ -191,7 +661,7 @@ class TableOperations:
             valid_positions = ["end", "beginning", "at_index"]
             validate_position_parameter(position, valid_positions)
             
-            document = self.document_manager.get_or_load_document(file_path)
+            document = self.document_manager.get_cached_or_load(file_path)
             
             validate_table_index(table_index, len(document.tables))
             table = document.tables[table_index]
@@ -199,19 +669,23 @@ class TableOperations:
             if position == "at_index" and row_index is None:
                 return OperationResponse.error("row_index required for 'at_index' position")
             
+            # Each len() re-walks the table XML, so count once and track changes
+            row_count = len(table.rows)
+            col_count = len(table.columns)
+            
             if position == "at_index":
-                validate_cell_position(row_index, 0, len(table.rows), len(table.columns))
+                validate_cell_position(row_index, 0, row_count, col_count)
             
             # Determine reference row for style copying
             reference_row = None
             if copy_style_from_row is not None:
                 # Explicit row specified
-                if copy_style_from_row < 0 or copy_style_from_row >= len(table.rows):
+                if copy_style_from_row < 0 or copy_style_from_row >= row_count:
                     return OperationResponse.error(f"Invalid copy_style_from_row: {copy_style_from_row}")
                 reference_row = table.rows[copy_style_from_row]
             else:
                 # Default behavior: copy from the last row (if table has rows)
-                if len(table.rows) > 0:
+                if row_count > 0:
                     if position == "end":
                         # For end insertion, copy from last row
                         reference_row = table.rows[-1]
@@ -222,46 +696,44 @@ class TableOperations:
                         # For index insertion, copy from the row at that index (or previous if available)
                         if row_index > 0:
                             reference_row = table.rows[row_index - 1]
-                        elif row_index < len(table.rows):
+                        elif row_index < row_count:
                             reference_row = table.rows[row_index]
             
-            # Keep track of newly added rows for styling
-            new_rows = []
-            original_row_count = len(table.rows)
+            # Add rows. table.add_row() always appends, so rows bound for the
+            # beginning or an index are moved into place with one slice
+            # assignment rather than one insert per row.
+            tbl = table._tbl
+            anchor_tr = None
+            if position == "beginning" and row_count > 0:
+                anchor_tr = tbl.tr_lst[0]
+            elif position == "at_index":
+                anchor_tr = tbl.tr_lst[row_index]
+            
+            new_trs = [table.add_row()._tr for _ in range(count)]
+            row_count += count
+            
+            if anchor_tr is not None:
+                insert_at = tbl.index(anchor_tr)
+                tbl[insert_at:insert_at] = new_trs
+            
+            # Apply styling to new rows; plain row additions have nothing to apply
+            if (reference_row is not None or default_text_format
+                    or default_alignment or default_background_color):
+                self._apply_row_styling(
+                    table,
+                    new_trs, 
+                    reference_row, 
+                    default_text_format, 
+                    default_alignment, 
+                    default_background_color
+                )
             
-            # Add rows
-            for i in range(count):
-                if position == "end":
-                    new_row = table.add_row()
-                    new_rows.append(new_row)
-                elif position == "beginning":
-                    # Insert at beginning - not directly supported, need to work around
-                    new_row = table.add_row()
-                    # Move new row to beginning
-                    table._element.insert(i, new_row._element)
-                    new_rows.append(new_row)
-                elif position == "at_index":
-                    # Insert at specific index
-                    new_row = table.add_row()
-                    # Move to desired position
-                    if row_index + i < len(table.rows) - 1:
-                        target_row = table.rows[row_index + i]
-                        target_row._element.addprevious(new_row._element)
-                    new_rows.append(new_row)
-            
-            # Apply styling to new rows
-            self._apply_row_styling(
-                new_rows, 
-                reference_row, 
-                default_text_format, 
-                default_alignment, 
-                default_background_color
-            )
+            self.document_manager.mark_modified(file_path)
             
             data = {
                 "table_index": table_index,
                 "rows_added": count,
-                "new_row_count": len(table.rows),
+                "new_row_count": row_count,
                 "position": position
             }
             
@@ -300,12 +772,13 @@ class TableOperations:
             valid_positions = ["end", "beginning", "at_index"]
             validate_position_parameter(position, valid_positions)
             
-            document = self.document_manager.get_or_load_document(file_path)
+            document = self.document_manager.get_cached_or_load(file_path)
             
             validate_table_index(table_index, len(document.tables))
             table = document.tables[table_index]
             
-            if not table.rows:
+            row_count = len(table.rows)
+            if not row_count:
                 return OperationResponse.error("Cannot add columns to empty table")
             
             original_cols = len(table.columns)
@@ -314,21 +787,38 @@ class TableOperations:
                 return OperationResponse.error("column_index required for 'at_index' position")
             
             if position == "at_index":
-                validate_cell_position(0, column_index, len(table.rows), original_cols)
-            
-            # Add columns by adding cells to each row
-            for _ in range(count):
-                for row in table.rows:
-                    if position == "end":
-                        row.cells[-1]._element.addnext(row.cells[0]._element.__class__())
-                    elif position == "beginning":
-                        row.cells[0]._element.addprevious(row.cells[0]._element.__class__())
-                    elif position == "at_index":
-                        target_cell = row.cells[column_index]
-                        target_cell._element.addprevious(row.cells[0]._element.__class__())
+                validate_cell_position(0, column_index, row_count, original_cols)
+            
+            # Add columns by adding cells to each row. Work on the <w:tc>
+            # elements directly: row.cells re-expands the whole row (and walks
+            # up vertical merges) on every access.
+            # New cells are copied from a template that already holds the
+            # paragraph Word requires in every cell.
+            tc_template = parse_xml(_TC_XML)
+            for tr in table._tbl.tr_lst:
+                tcs = tr.tc_lst
+                if not tcs:
+                    continue
+                if position == "end":
+                    anchor = tcs[-1]
+                    for _ in range(count):
+                        anchor.addnext(deepcopy(tc_template))
+                elif position == "beginning":
+                    anchor = tcs[0]
+                    for _ in range(count):
+                        anchor.addprevious(deepcopy(tc_template))
+                elif position == "at_index":
+                    anchor = _tc_at_grid_column(tcs, column_index)
+                    for _ in range(count):
+                        if anchor is None:
+                            tcs[-1].addnext(deepcopy(tc_template))
+                        else:
+                            anchor.addprevious(deepcopy(tc_template))
             
             new_cols = len(table.columns)
             
+            self.document_manager.mark_modified(file_path)
+            
             data = {
                 "table_index": table_index,
                 "columns_added": count,
@@ -361,27 +851,49 @@ class TableOperations:
             if not row_indices:
                 return OperationResponse.error("No row indices provided")
             
-            document = self.document_manager.get_or_load_document(file_path)
+            document = self.document_manager.get_cached_or_load(file_path)
             
             validate_table_index(table_index, len(document.tables))
             table = document.tables[table_index]
             
-            # Validate all row indices
-            for row_idx in row_indices:
-                validate_cell_position(row_idx, 0, len(table.rows), len(table.columns))
+            row_count = len(table.rows)
+            col_count = len(table.columns)
+            
+            sorted_indices = sorted(set(row_indices))
             
-            # Sort indices in reverse order to delete from end to beginning
-            sorted_indices = sorted(set(row_indices), reverse=True)
+            # Validate all row indices; only the extremes can be out of range
+            validate_cell_position(sorted_indices[0], 0, row_count, col_count)
+            validate_cell_position(sorted_indices[-1], 0, row_count, col_count)
             
-            # Delete rows
+            # Collapse the indices into contiguous [start, end) runs
+            runs = []
             for row_idx in sorted_indices:
-                row = table.rows[row_idx]
-                row._element.getparent().remove(row._element)
+                if runs and runs[-1][1] == row_idx:
+                    runs[-1][1] = row_idx + 1
+                else:
+                    runs.append([row_idx, row_idx + 1])
+            
+            # Delete runs from the end so earlier child positions stay valid.
+            # A run is spliced out in one slice deletion when its rows are
+            # adjacent children of <w:tbl>; otherwise (e.g. a bookmark between
+            # rows) each row is removed individually.
+            tbl = table._tbl
+            trs = tbl.tr_lst
+            for start, end in reversed(runs):
+                child_start = tbl.index(trs[start])
+                child_end = child_start + (end - start)
+                if end - start > 1 and tbl[child_end - 1] is trs[end - 1]:
+                    del tbl[child_start:child_end]
+                else:
+                    for tr in trs[start:end]:
+                        tbl.remove(tr)
+            
+            self.document_manager.mark_modified(file_path)
             
             data = {
                 "table_index": table_index,
                 "rows_deleted": len(sorted_indices),
-                "remaining_rows": len(table.rows)
+                "remaining_rows": row_count - len(sorted_indices)
             }
             
             return OperationResponse.success(
@@ -403,7 +915,8 @@ class TableOperations:
         text_format: Optional[TextFormat] = None,
         alignment: Optional[Dict[str, str]] = None,
         background_color: Optional[str] = None,
-        preserve_existing_format: bool = True
+        preserve_existing_format: bool = True,
+        return_applied_formatting: bool = True
     ) -> OperationResponse:
         """
         Set the value of a specific cell with optional formatting.
@@ -418,15 +931,14 @@ class TableOperations:
             alignment: Optional alignment settings {"horizontal": "left/center/right", "vertical": "top/middle/bottom"}
             background_color: Optional background color as hex string (e.g., "FFFF00")
             preserve_existing_format: Whether to preserve existing formatting when not specified
+            return_applied_formatting: Whether to re-read the cell for the reported
+                formatting; when False the values that were written are reported
             
         Returns:
             OperationResponse with operation result
         """
         try:
-            from docx.shared import RGBColor
-            from docx.enum.text import WD_ALIGN_PARAGRAPH
-            
-            document = self.document_manager.get_or_load_document(file_path)
+            document = self.document_manager.get_cached_or_load(file_path)
             
             validate_table_index(table_index, len(document.tables))
             table = document.tables[table_index]
@@ -436,192 +948,22 @@ class TableOperations:
             # Get cell and set value
             cell = table.cell(row_index, column_index)
             
-            # Store existing formatting if preserve_existing_format is True
-            existing_format = None
-            if preserve_existing_format:
-                existing_format = extract_cell_formatting(cell)
-            
-            # Clear existing content and set new value
-            cell.text = sanitize_string(value)
-            
-            # Apply formatting if provided
-            if cell.paragraphs:
-                paragraph = cell.paragraphs[0]
+            if (text_format is None and alignment is None and background_color is None
+                    and preserve_existing_format and _cell_holds_text(cell, sanitize_string(value))):
+                # Rewriting would reproduce the same text and formatting
+                final_format = extract_cell_formatting(cell)
+            else:
+                written_format = self._write_cell(
+                    cell, value, text_format, alignment, background_color, preserve_existing_format
+                )
                 
-                # Apply paragraph alignment
-                if alignment and alignment.get('horizontal'):
-                    h_align = alignment['horizontal'].lower()
-                    alignment_map = {
-                        'left': WD_ALIGN_PARAGRAPH.LEFT,
-                        'center': WD_ALIGN_PARAGRAPH.CENTER,
-                        'right': WD_ALIGN_PARAGRAPH.RIGHT,
-                        'justify': WD_ALIGN_PARAGRAPH.JUSTIFY
-                    }
-                    if h_align in alignment_map:
-                        paragraph.alignment = alignment_map[h_align]
-                elif preserve_existing_format and existing_format and existing_format.get('horizontal_alignment'):
-                    # Restore existing alignment
-                    h_align = existing_format['horizontal_alignment']
-                    alignment_map = {
-                        'left': WD_ALIGN_PARAGRAPH.LEFT,
-                        'center': WD_ALIGN_PARAGRAPH.CENTER,
-                        'right': WD_ALIGN_PARAGRAPH.RIGHT,
-                        'justify': WD_ALIGN_PARAGRAPH.JUSTIFY
-                    }
-                    if h_align in alignment_map:
-                        paragraph.alignment = alignment_map[h_align]
+                # Get final formatting for response
+                if return_applied_formatting:
+                    final_format = extract_cell_formatting(cell)
+                else:
+                    final_format = written_format
                 
-                # Apply text formatting to runs
-                if paragraph.runs:
-                    run = paragraph.runs[0]
-                    
-                    # Apply text formatting
-                    if preserve_existing_format and existing_format:
-                        # First restore existing text formatting
-                        if existing_format.get('font_family'):
-                            run.font.name = existing_format['font_family']
-                        if existing_format.get('font_size'):
-                            from docx.shared import Pt
-                            run.font.size = Pt(existing_format['font_size'])
-                        if existing_format.get('font_color'):
-                            try:
-                                color_hex = existing_format['font_color'].lstrip('#')
-                                if len(color_hex) == 6:
-                                    r = int(color_hex[0:2], 16)
-                                    g = int(color_hex[2:4], 16)
-                                    b = int(color_hex[4:6], 16)
-                                    run.font.color.rgb = RGBColor(r, g, b)
-                            except (ValueError, AttributeError):
-                                pass
-                        if existing_format.get('is_bold') is not None:
-                            run.font.bold = existing_format['is_bold']
-                        if existing_format.get('is_italic') is not None:
-                            run.font.italic = existing_format['is_italic']
-                        if existing_format.get('is_underlined') is not None:
-                            run.font.underline = existing_format['is_underlined']
-                    
-                    # Then apply new text formatting (overrides existing)
-                    if text_format:
-                        if text_format.font_family:
-                            run.font.name = text_format.font_family
-                        if text_format.font_size:
-                            from docx.shared import Pt
-                            run.font.size = Pt(text_format.font_size)
-                        if text_format.font_color:
-                            # Parse hex color
-                            try:
-                                color_hex = text_format.font_color.lstrip('#')
-                                if len(color_hex) == 6:
-                                    r = int(color_hex[0:2], 16)
-                                    g = int(color_hex[2:4], 16)
-                                    b = int(color_hex[4:6], 16)
-                                    run.font.color.rgb = RGBColor(r, g, b)
-                            except (ValueError, AttributeError):
-                                pass  # Skip invalid color
-                        if text_format.bold is not None:
-                            run.font.bold = text_format.bold
-                        if text_format.italic is not None:
-                            run.font.italic = text_format.italic
-                        if text_format.underline is not None:
-                            run.font.underline = text_format.underline
-            
-            # Apply vertical alignment if provided
-            if alignment and alignment.get('vertical'):
-                try:
-                    from docx.oxml.shared import qn, OxmlElement
-                    
-                    v_align = alignment['vertical'].lower()
-                    alignment_map = {
-                        'top': 'top',
-                        'middle': 'center',
-                        'bottom': 'bottom'
-                    }
-                    
-                    if v_align in alignment_map:
-                        tc_pr = cell._element.get_or_add_tcPr()
-                        
-                        # Remove existing vAlign if present
-                        existing_valign = tc_pr.find(qn('w:vAlign'))
-                        if existing_valign is not None:
-                            tc_pr.remove(existing_valign)
-                        
-                        # Add new vAlign
-                        valign_element = OxmlElement('w:vAlign')
-                        valign_element.set(qn('w:val'), alignment_map[v_align])
-                        tc_pr.append(valign_element)
-                except Exception:
-                    pass  # Skip if vertical alignment application fails
-            elif preserve_existing_format and existing_format and existing_format.get('vertical_alignment'):
-                # Restore existing vertical alignment
-                try:
-                    from docx.oxml.shared import qn, OxmlElement
-                    
-                    v_align = existing_format['vertical_alignment'].lower()
-                    alignment_map = {
-                        'top': 'top',
-                        'middle': 'center',
-                        'bottom': 'bottom'
-                    }
-                    
-                    if v_align in alignment_map:
-                        tc_pr = cell._element.get_or_add_tcPr()
-                        
-                        # Remove existing vAlign if present
-                        existing_valign = tc_pr.find(qn('w:vAlign'))
-                        if existing_valign is not None:
-                            tc_pr.remove(existing_valign)
-                        
-                        # Add new vAlign
-                        valign_element = OxmlElement('w:vAlign')
-                        valign_element.set(qn('w:val'), alignment_map[v_align])
-                        tc_pr.append(valign_element)
-                except Exception:
-                    pass
-            
-            # Apply background color if provided
-            if background_color:
-                try:
-                    # Apply cell shading using proper XML construction
-                    from docx.oxml.shared import qn
-                    from docx.oxml import parse_xml
-                    
-                    tc_pr = cell._element.get_or_add_tcPr()
-                    
-                    # Remove existing shading if present
-                    existing_shd = tc_pr.find(qn('w:shd'))
-                    if existing_shd is not None:
-                        tc_pr.remove(existing_shd)
-                    
-                    # Create new shading element with proper namespace
-                    shd_xml = f'''<w:shd xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" 
-                                 w:val="clear" w:color="auto" w:fill="{background_color.lstrip('#')}"/>'''
-                    shd_element = parse_xml(shd_xml)
-                    tc_pr.append(shd_element)
-                except Exception:
-                    pass  # Skip if background color application fails
-            elif preserve_existing_format and existing_format and existing_format.get('background_color'):
-                # Restore existing background color
-                try:
-                    from docx.oxml.shared import qn
-                    from docx.oxml import parse_xml
-                    
-                    tc_pr = cell._element.get_or_add_tcPr()
-                    
-                    # Remove existing shading if present
-                    existing_shd = tc_pr.find(qn('w:shd'))
-                    if existing_shd is not None:
-                        tc_pr.remove(existing_shd)
-                    
-                    # Create new shading element with proper namespace
-                    shd_xml = f'''<w:shd xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" 
-                                 w:val="clear" w:color="auto" w:fill="{existing_format["background_color"].lstrip('#')}"/>'''
-                    shd_element = parse_xml(shd_xml)
-                    tc_pr.append(shd_element)
-                except Exception:
-                    pass
-            
-            # Get final formatting for response
-            final_format = extract_cell_formatting(cell)
+                self.document_manager.mark_modified(file_path)
             
             data = {
                 "table_index": table_index,
@@ -655,6 +997,203 @@ class TableOperations:
         except Exception as e:
             return OperationResponse.error(f"Failed to set cell value: {str(e)}")
     
+    def _write_cell(
+        self,
+        cell: _Cell,
+        value: str,
+        text_format: Optional[TextFormat],
+        alignment: Optional[Dict[str, str]],
+        background_color: Optional[str],
+        preserve_existing_format: bool
+    ) -> Dict[str, Any]:
+        """
+        Write a value into a cell and apply or restore its formatting.
+        
+        Args:
+            cell: Cell to write
+            value: Value to set
+            text_format: Optional text formatting
+            alignment: Optional alignment settings {"horizontal": ..., "vertical": ...}
+            background_color: Optional background color as hex string
+            preserve_existing_format: Whether to preserve existing formatting when not specified
+            
+        Returns:
+            The formatting written to the cell, keyed like extract_cell_formatting
+        """
+        # Store existing formatting if preserve_existing_format is True
+        existing = {}
+        if preserve_existing_format:
+            existing = extract_cell_formatting(cell) or {}
+        
+        # Resolve the final value of each property once: a new value wins,
+        # otherwise the preserved one is kept.
+        h_align_name = existing.get('horizontal_alignment')
+        if alignment and alignment.get('horizontal'):
+            h_align_name = alignment['horizontal'].lower()
+        h_align = _H_ALIGN_MAP.get(h_align_name) if h_align_name else None
+        if h_align is None:
+            h_align_name = None
+        
+        tf = text_format or TextFormat()
+        font_family = tf.font_family or existing.get('font_family')
+        font_size = tf.font_size or existing.get('font_size')
+        rgb = _hex_to_rgbcolor(tf.font_color) if tf.font_color else None
+        if rgb is None and existing.get('font_color'):
+            rgb = _hex_to_rgbcolor(existing['font_color'])
+        bold = tf.bold if tf.bold is not None else existing.get('is_bold')
+        italic = tf.italic if tf.italic is not None else existing.get('is_italic')
+        underline = tf.underline if tf.underline is not None else existing.get('is_underlined')
+        
+        # Clear existing content and set new value
+        cell.text = sanitize_string(value)
+        
+        # Apply formatting if provided
+        if cell.paragraphs:
+            paragraph = cell.paragraphs[0]
+            
+            if h_align is not None:
+                paragraph.alignment = h_align
+            
+            # Apply text formatting to runs
+            if paragraph.runs:
+                run = paragraph.runs[0]
+                
+                if font_family:
+                    run.font.name = font_family
+                if font_size:
+                    run.font.size = Pt(font_size)
+                if rgb is not None:
+                    run.font.color.rgb = rgb
+                if bold is not None:
+                    run.font.bold = bold
+                if italic is not None:
+                    run.font.italic = italic
+                if underline is not None:
+                    run.font.underline = underline
+        
+        # Setting cell.text keeps <w:tcPr>, so the existing vertical alignment
+        # and shading survive on their own; only new values need writing.
+        tc_pr = None
+        v_align = existing.get('vertical_alignment')
+        if alignment and alignment.get('vertical'):
+            new_v_align = _V_ALIGN_MAP.get(alignment['vertical'].lower())
+            if new_v_align is not None:
+                tc_pr = cell._element.get_or_add_tcPr()
+                _apply_valign(tc_pr, new_v_align)
+                v_align = new_v_align
+        
+        fill = existing.get('background_color')
+        new_fill = _normalize_hex_color(background_color) if background_color else None
+        if new_fill is not None:
+            if tc_pr is None:
+                tc_pr = cell._element.get_or_add_tcPr()
+            _apply_shading(tc_pr, new_fill)
+            fill = new_fill
+        
+        return {
+            "font_family": font_family,
+            "font_size": font_size,
+            "font_color": str(rgb) if rgb is not None else None,
+            "is_bold": bold or False,
+            "is_italic": italic or False,
+            "is_underlined": underline or False,
+            "horizontal_alignment": h_align_name,
+            "vertical_alignment": v_align,
+            "background_color": fill,
+        }
+    
+    def set_cells(
+        self,
+        file_path: str,
+        table_index: int,
+        updates: List[Union[CellUpdate, Dict[str, Any]]]
+    ) -> OperationResponse:
+        """
+        Set the values of several cells in one table.
+        
+        The document and table are resolved once and every position is
+        validated before any cell is written, so an out-of-range update
+        leaves the table unchanged.
+        
+        Args:
+            file_path: Path to the document
+            table_index: Index of the table
+            updates: Cell updates, as CellUpdate objects or dictionaries with
+                row_index, column_index, value and the optional formatting
+                keys accepted by set_cell_value
+            
+        Returns:
+            OperationResponse with the number of cells written and per-cell errors
+        """
+        try:
+            if not updates:
+                return OperationResponse.error("No cell updates provided")
+            
+            try:
+                updates = [
+                    u if isinstance(u, CellUpdate) else CellUpdate.from_dict(u)
+                    for u in updates
+                ]
+            except (KeyError, TypeError) as e:
+                return OperationResponse.error(f"Invalid cell update: {str(e)}")
+            
+            document = self.document_manager.get_cached_or_load(file_path)
+            
+            validate_table_index(table_index, len(document.tables))
+            table = document.tables[table_index]
+            
+            row_count = len(table.rows)
+            col_count = len(table.columns)
+            for update in updates:
+                validate_cell_position(update.row_index, update.column_index, row_count, col_count)
+            
+            # Group by row so each row's cells are resolved once; table.cell()
+            # rebuilds the whole table's cell grid on every call.
+            updates_by_row: Dict[int, List[CellUpdate]] = {}
+            for update in updates:
+                updates_by_row.setdefault(update.row_index, []).append(update)
+            
+            updated = 0
+            errors = []
+            for row_index, row_updates in updates_by_row.items():
+                row_cells = table.row_cells(row_index)
+                for update in row_updates:
+                    try:
+                        self._write_cell(
+                            row_cells[update.column_index],
+                            update.value,
+                            update.text_format,
+                            update.alignment,
+                            update.background_color,
+                            update.preserve_existing_format
+                        )
+                        updated += 1
+                    except Exception as e:
+                        errors.append({
+                            "row_index": update.row_index,
+                            "column_index": update.column_index,
+                            "error": str(e)
+                        })
+            
+            self.document_manager.mark_modified(file_path)
+            
+            data = {
+                "table_index": table_index,
+                "updated_cells": updated,
+                "failed_cells": len(errors),
+                "errors": errors
+            }
+            
+            return OperationResponse.success(
+                f"Set {updated} of {len(updates)} cells in table {table_index}",
+                data
+            )
+            
+        except (InvalidTableIndexError, InvalidCellPositionError) as e:
+            return OperationResponse.error(str(e))
+        except Exception as e:
+            return OperationResponse.error(f"Failed to set cells: {str(e)}")
+    
     def get_cell_value(
         self, 
         file_path: str, 
@@ -677,7 +1216,7 @@ class TableOperations:
             OperationResponse with cell value and formatting
         """
         try:
-            document = self.document_manager.get_or_load_document(file_path)
+            document = self.document_manager.get_cached_or_load(file_path)
             
             validate_table_index(table_index, len(document.tables))
             table = document.tables[table_index]
@@ -750,6 +1289,7 @@ class TableOperations:
         table_index: int,
         include_headers: bool = True,
         format_type: str = "array",
+        csv_as_list: bool = False,
     ) -> OperationResponse:
         """
         Get all data from a table.
@@ -759,6 +1299,7 @@ class TableOperations:
             table_index: Index of the table
             include_headers: Whether to include headers
             format_type: Format of returned data ('array', 'object', 'csv')
+            csv_as_list: Return 'csv' data as a list of rows instead of a CSV string
             
         Returns:
             OperationResponse with table data
@@ -768,56 +1309,48 @@ class TableOperations:
             if format_type not in valid_formats:
                 return OperationResponse.error(f"Invalid format. Valid options: {', '.join(valid_formats)}")
             
-            document = self.document_manager.get_or_load_document(file_path)
+            document = self.document_manager.get_cached_or_load(file_path)
             
             validate_table_index(table_index, len(document.tables))
             table = document.tables[table_index]
             
-            if not table.rows:
+            # Extract data; repeated reads of an unmodified document reuse the
+            # cached texts, which are shared, so the response gets its own lists
+            text_rows = self._cached_table_texts(file_path, document, table_index, table)
+            if not text_rows:
                 return OperationResponse.success("Table is empty", {"data": []})
             
-            # Extract data
-            data = []
-            headers = None
-            
-            start_row = 0
-            if include_headers and table.rows:
-                # Extract headers from first row
-                headers = [cell.text for cell in table.rows[0].cells]
-                start_row = 1
-            
-            # Extract data rows
-            for row in table.rows[start_row:]:
-                row_data = [cell.text for cell in row.cells]
-                data.append(row_data)
+            # The first row is the header row when headers are requested;
+            # array and csv output list it first either way, so every format
+            # reads straight from the cached rows
+            start_row = 1 if include_headers else 0
+            row_count = len(text_rows) - start_row
+            column_count = len(text_rows[start_row]) if row_count else 0
             
             # Format data according to requested format
-            if format_type == "array":
-                result_data = data
-                if include_headers and headers:
-                    result_data = [headers] + data
-            elif format_type == "object":
-                if headers:
-                    result_data = []
-                    for row in data:
-                        row_dict = {}
-                        for i, value in enumerate(row):
-                            header = headers[i] if i < len(headers) else f"Column_{i}"
-                            row_dict[header] = value
-                        result_data.append(row_dict)
-                else:
-                    result_data = [{"Column_" + str(i): value for i, value in enumerate(row)} for row in data]
-            elif format_type == "csv":
-                result_data = []
-                if include_headers and headers:
-                    result_data.append(headers)
-                result_data.extend(data)
+            if format_type == "object":
+                headers = list(text_rows[0]) if include_headers else None
+                # Resolve the key of every column once; rows wider than the
+                # header fall back to Column_<i> keys, and zip stops at the end
+                # of shorter rows
+                width = max(map(len, islice(text_rows, start_row, None)), default=0)
+                keys = list(headers) if headers else []
+                keys.extend(f"Column_{i}" for i in range(len(keys), width))
+                result_data = [dict(zip(keys, row)) for row in islice(text_rows, start_row, None)]
+            elif format_type == "csv" and not csv_as_list:
+                headers = list(text_rows[0]) if include_headers else None
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows(text_rows)
+                result_data = buffer.getvalue()
+            else:
+                result_data = [list(row) for row in text_rows]
+                headers = result_data[0] if include_headers else None
             
             response_data = {
                 "table_index": table_index,
                 "format": format_type,
-                "rows": len(data),
-                "columns": len(data[0]) if data else 0,
+                "rows": row_count,
+                "columns": column_count,
                 "has_headers": bool(headers),
                 "headers": headers,
                 "data": result_data
@@ -842,27 +1375,31 @@ class TableOperations:
             OperationResponse with list of tables
         """
         try:
-            document = self.document_manager.get_or_load_document(file_path)
+            document = self.document_manager.get_cached_or_load(file_path)
             
             tables = []
             for i, table in enumerate(document.tables):
+                rows = table.rows
+                n_rows = len(rows)
                 table_info = {
                     "index": i,
-                    "rows": len(table.rows),
-                    "columns": len(table.columns) if table.rows else 0,
+                    "rows": n_rows,
+                    "columns": len(table.columns) if n_rows else 0,
                 }
                 
                 if include_summary:
+                    # Read the first row's cell texts once for both fields
+                    first_row_data = (_first_row_texts(table) or []) if n_rows else []
+                    
                     # Check if has headers (simple heuristic)
-                    has_headers = False
-                    if table.rows:
-                        first_row_has_text = all(cell.text.strip() for cell in table.rows[0].cells)
-                        has_headers = first_row_has_text
+                    has_headers = n_rows > 0 and all(
+                        text and not text.isspace() for text in first_row_data
+                    )
                     
                     table_info.update({
                         "has_headers": has_headers,
                         "style": getattr(table.style, 'name', None) if table.style else None,
-                        "first_row_data": [cell.text for cell in table.rows[0].cells] if table.rows else []
+                        "first_row_data": first_row_data
                     })
                 
                 tables.append(table_info)
@@ -908,18 +1445,18 @@ class TableOperations:
             if search_mode not in valid_modes:
                 return OperationResponse.error(f"Invalid search mode. Valid options: {', '.join(valid_modes)}")
             
-            document = self.document_manager.get_or_load_document(file_path)
+            document = self.document_manager.get_cached_or_load(file_path)
             
             # Determine which tables to search
+            tables = document.tables
             if table_indices is None:
-                tables_to_search = list(range(len(document.tables)))
+                tables_to_search = list(range(len(tables)))
             else:
                 # Validate table indices
                 for idx in table_indices:
-                    validate_table_index(idx, len(document.tables))
+                    validate_table_index(idx, len(tables))
                 tables_to_search = table_indices
             
-            matches = []
             summary = {
                 "tables_with_matches": 0,
                 "matches_per_table": {},
@@ -930,52 +1467,17 @@ class TableOperations:
             pattern = None
             if search_mode == "regex":
                 try:
-                    flags = 0 if case_sensitive else re.IGNORECASE
-                    pattern = re.compile(query, flags)
+                    pattern = _compile_search_pattern(query, case_sensitive)
                 except re.error as e:
                     return OperationResponse.error(f"Invalid regex pattern: {str(e)}")
             
-            # Search each table
-            for table_idx in tables_to_search:
-                table = document.tables[table_idx]
-                table_matches = 0
-                
-                for row_idx, row in enumerate(table.rows):
-                    for col_idx, cell in enumerate(row.cells):
-                        cell_text = cell.text
-                        summary["total_cells_searched"] += 1
-                        
-                        # Perform search based on mode
-                        cell_matches = self._search_cell_content(
-                            cell_text, query, search_mode, case_sensitive, pattern
-                        )
-                        
-                        # Create match objects
-                        for match_info in cell_matches:
-                            if max_results and len(matches) >= max_results:
-                                break
-                                
-                            match = TableSearchMatch(
-                                table_index=table_idx,
-                                row_index=row_idx,
-                                column_index=col_idx,
-                                cell_value=cell_text,
-                                match_text=match_info["text"],
-                                match_start=match_info["start"],
-                                match_end=match_info["end"]
-                            )
-                            matches.append(match)
-                            table_matches += 1
-                        
-                        if max_results and len(matches) >= max_results:
-                            break
-                    
-                    if max_results and len(matches) >= max_results:
-                        break
-                
-                if table_matches > 0:
-                    summary["tables_with_matches"] += 1
-                    summary["matches_per_table"][table_idx] = table_matches
+            # The generator stops scanning as soon as islice has taken enough
+            found = self._iter_table_matches(
+                file_path, document, tables, tables_to_search,
+                query, search_mode, case_sensitive, pattern, summary
+            )
+            matches = list(islice(found, max_results) if max_results else found)
+            summary["tables_with_matches"] = len(summary["matches_per_table"])
             
             # Create search result
             search_result = TableSearchResult(
@@ -999,80 +1501,307 @@ class TableOperations:
         except Exception as e:
             return OperationResponse.error(f"Failed to search table content: {str(e)}")
     
-    def _search_cell_content(
+    def _table_cache_entries(self, file_path: str, document: Document) -> Dict[tuple, Any]:
+        """Return the derived-text cache of a document, emptied if the document changed."""
+        revision = self.document_manager.get_revision(file_path)
+        entry = self._table_text_cache.get(file_path)
+        if entry is None or entry[0]() is not document or entry[1] != revision:
+            entry = (weakref.ref(document), revision, {})
+            self._table_text_cache[file_path] = entry
+        return entry[2]
+    
+    def _cached_table_haystack(
         self,
-        cell_text: str,
+        file_path: str,
+        document: Document,
+        table_index: int,
+        table: Table,
+        lowered: bool = False
+    ) -> Tuple[str, int]:
+        """
+        Return a table's cell texts joined by NUL characters, and the number of cells.
+        
+        A single substring test on the joined text tells whether any cell can
+        contain a literal. It is kept alongside the cached rows, so repeated
+        searches of an unchanged document skip the per-cell join as well.
+        
+        Args:
+            file_path: Path to the document
+            document: Loaded document the table belongs to
+            table_index: Index of the table in the document
+            table: The table itself
+            lowered: Whether to join the lowercased texts
+            
+        Returns:
+            Tuple of (joined text, cell count)
+        """
+        entries = self._table_cache_entries(file_path, document)
+        key = ("joined", table_index, lowered)
+        haystack = entries.get(key)
+        if haystack is None:
+            rows = self._cached_table_texts(file_path, document, table_index, table, lowered)
+            cell_texts = [text for row_texts in rows for text in row_texts]
+            haystack = entries[key] = ("\x00".join(cell_texts), len(cell_texts))
+        return haystack
+    
+    def _cached_table_texts(
+        self,
+        file_path: str,
+        document: Document,
+        table_index: int,
+        table: Table,
+        lowered: bool = False
+    ) -> List[List[str]]:
+        """
+        Return a table's cell text rows, optionally lowercased, reusing earlier reads.
+        
+        Entries live until the document is marked modified or replaced by a
+        fresh parse. Callers must not mutate the returned lists.
+        
+        Args:
+            file_path: Path to the document
+            document: Loaded document the table belongs to
+            table_index: Index of the table in the document
+            table: The table itself
+            lowered: Whether to return the lowercased texts
+            
+        Returns:
+            Cell texts laid out like _table_text_rows
+        """
+        rows_by_key = self._table_cache_entries(file_path, document)
+        
+        rows = rows_by_key.get((table_index, lowered))
+        if rows is None:
+            if lowered:
+                texts = self._cached_table_texts(file_path, document, table_index, table)
+                rows = [[text.lower() for text in row] for row in texts]
+            else:
+                rows = _table_text_rows(table)
+            rows_by_key[(table_index, lowered)] = rows
+        return rows
+    
+    def _iter_table_matches(
+        self,
+        file_path: str,
+        document: Document,
+        tables: List[Table],
+        tables_to_search: List[int],
         query: str,
         search_mode: str,
         case_sensitive: bool,
-        pattern: Optional[re.Pattern] = None
-    ) -> List[Dict[str, Any]]:
+        pattern: Optional[re.Pattern],
+        summary: Dict[str, Any]
+    ) -> Iterator[TableSearchMatch]:
         """
-        Search for matches within a single cell's content.
+        Yield content matches table by table, row by row, in document order.
+        
+        Cell text is read straight from the table XML. Cells are only scanned
+        as matches are consumed, and summary's cell and per-table match counts
+        are updated as the generator advances.
         
         Args:
-            cell_text: The cell's text content
+            file_path: Path to the document
+            document: Loaded document
+            tables: Tables of the document
+            tables_to_search: Indices of the tables to scan
             query: Search query
             search_mode: Search mode
             case_sensitive: Case sensitivity flag
             pattern: Compiled regex pattern (for regex mode)
+            summary: Search summary updated in place
             
-        Returns:
-            List of match information dictionaries
+        Yields:
+            TableSearchMatch for each match found
+        """
+        # Lowercased text is only needed for case-insensitive literal modes
+        fold_case = not case_sensitive and search_mode != "regex"
+        # Exact and contains matches both require the query as a substring
+        needle = None
+        if search_mode != "regex":
+            needle = query if case_sensitive else query.lower()
+        # Regex matches must contain the pattern's required literal, if it has one
+        regex_literal = _required_literal(query) if search_mode == "regex" else None
+        matches_per_table = summary["matches_per_table"]
+        
+        # Dispatch on the search mode and normalise the query once, not per cell
+        matcher_fn = self._make_matcher(query, search_mode, case_sensitive, pattern)
+        
+        for table_idx in tables_to_search:
+            table = tables[table_idx]
+            text_rows = self._cached_table_texts(file_path, document, table_idx, table)
+            # Lowercased texts are cached too, so repeated case-insensitive
+            # searches of an unchanged document lower each cell only once
+            lower_rows = None
+            if fold_case:
+                lower_rows = self._cached_table_texts(
+                    file_path, document, table_idx, table, lowered=True
+                )
+            
+            if needle is not None:
+                # One substring scan over the whole table's text rejects
+                # tables without a hit before any per-cell dispatch. Every
+                # cell-level hit is also a hit in the joined text, so this
+                # only ever skips tables that have no matches.
+                joined, n_cells = self._cached_table_haystack(
+                    file_path, document, table_idx, table, lowered=fold_case
+                )
+                if needle not in joined:
+                    summary["total_cells_searched"] += n_cells
+                    continue
+            elif regex_literal is not None:
+                # The same table-level reject for regexes. Case-insensitive
+                # patterns can match non-ASCII text that folds onto ASCII
+                # letters, so those tables are only rejected when all-ASCII.
+                joined, n_cells = self._cached_table_haystack(
+                    file_path, document, table_idx, table
+                )
+                if case_sensitive:
+                    rejected = regex_literal not in joined
+                elif joined.isascii():
+                    joined_lc, _ = self._cached_table_haystack(
+                        file_path, document, table_idx, table, lowered=True
+                    )
+                    rejected = regex_literal.lower() not in joined_lc
+                else:
+                    rejected = False
+                if rejected:
+                    summary["total_cells_searched"] += n_cells
+                    continue
+            
+            for row_idx, row_texts in enumerate(text_rows):
+                lower_texts = lower_rows[row_idx] if fold_case else None
+                for col_idx, cell_text in enumerate(row_texts):
+                    summary["total_cells_searched"] += 1
+                    # Empty cells never match, not even a pattern like "^$"
+                    if not cell_text:
+                        continue
+                    
+                    if lower_texts is not None:
+                        cell_matches = matcher_fn(cell_text, lower_texts[col_idx])
+                    else:
+                        cell_matches = matcher_fn(cell_text)
+                    
+                    for match_text, start, end in cell_matches:
+                        matches_per_table[table_idx] = matches_per_table.get(table_idx, 0) + 1
+                        yield TableSearchMatch(
+                            table_index=table_idx,
+                            row_index=row_idx,
+                            column_index=col_idx,
+                            cell_value=cell_text,
+                            match_text=match_text,
+                            match_start=start,
+                            match_end=end
+                        )
+    
+    def _make_matcher(
+        self,
+        query: str,
+        search_mode: str,
+        case_sensitive: bool,
+        pattern: Optional[re.Pattern] = None
+    ) -> Callable[..., List[Tuple[str, int, int]]]:
         """
-        matches = []
+        Build a cell matcher specialised for one search mode.
         
-        if not cell_text:
-            return matches
+        The mode branch and the query normalisation happen once here instead
+        of on every cell. Exact and contains matchers accept the cell's
+        lowercased text as an optional second argument, so callers that
+        already hold it skip lowering the cell again.
+        
+        Args:
+            query: Search query
+            search_mode: Search mode ("exact", "contains", "regex")
+            case_sensitive: Case sensitivity flag
+            pattern: Compiled regex pattern (for regex mode)
+            
+        Returns:
+            Function mapping cell text to a list of (text, start, end) tuples
+        """
+        needle_lc = query if case_sensitive else query.lower()
+        nq = len(query)
         
         if search_mode == "exact":
-            # Exact match
-            search_text = cell_text if case_sensitive else cell_text.lower()
-            query_text = query if case_sensitive else query.lower()
-            
-            if search_text == query_text:
-                matches.append({
-                    "text": cell_text,
-                    "start": 0,
-                    "end": len(cell_text)
-                })
+            def _match_exact(text: str, text_lower: Optional[str] = None) -> List[Tuple[str, int, int]]:
+                if case_sensitive:
+                    search_text = text
+                else:
+                    search_text = text_lower if text_lower is not None else text.lower()
+                if search_text == needle_lc:
+                    return [(text, 0, len(text))]
+                return []
+            return _match_exact
         
-        elif search_mode == "contains":
-            # Contains match
-            search_text = cell_text if case_sensitive else cell_text.lower()
-            query_text = query if case_sensitive else query.lower()
-            
-            start = 0
-            while True:
-                pos = search_text.find(query_text, start)
-                if pos == -1:
-                    break
-                
-                matches.append({
-                    "text": cell_text[pos:pos + len(query)],
-                    "start": pos,
-                    "end": pos + len(query)
-                })
-                start = pos + 1
+        if search_mode == "contains":
+            literal = _compile_literal(needle_lc)
+            
+            def _match_contains(text: str, text_lower: Optional[str] = None) -> List[Tuple[str, int, int]]:
+                if case_sensitive:
+                    search_text = text
+                else:
+                    search_text = text_lower if text_lower is not None else text.lower()
+                # The substring test rejects most cells without entering SRE
+                if needle_lc not in search_text:
+                    return []
+                hits = []
+                for match in literal.finditer(search_text):
+                    pos = match.start()
+                    hits.append((text[pos:pos + nq], pos, pos + nq))
+                return hits
+            return _match_contains
         
-        elif search_mode == "regex":
-            # Regex match
-            if pattern:
-                for match in pattern.finditer(cell_text):
-                    matches.append({
-                        "text": match.group(),
-                        "start": match.start(),
-                        "end": match.end()
-                    })
+        # Case-insensitive ASCII regexes run against lowercased ASCII text
+        # without re.IGNORECASE, which skips SRE's per-character case folding.
+        # str.lower() preserves the length of ASCII text, so offsets still
+        # index into the original cell text. RE2 patterns are left as they
+        # are: folding them onto re would give up RE2's linear-time matching.
+        folded = None
+        # RE2 limits \d, \w, \s and \b to ASCII, so non-ASCII cells run
+        # patterns using them on re to get the same results as without RE2
+        unicode_pattern = pattern
+        if isinstance(pattern, re.Pattern):
+            if not case_sensitive:
+                folded_query = _fold_ascii_pattern(query)
+                if folded_query is not None:
+                    folded = re.compile(folded_query)
+        elif _uses_unicode_classes(query):
+            unicode_pattern = re.compile(query, 0 if case_sensitive else re.IGNORECASE)
+        
+        # Cells without the pattern's required literal cannot match, and a
+        # substring test is far cheaper than entering the regex engine. Under
+        # re.IGNORECASE some non-ASCII characters fold onto ASCII letters
+        # (e.g. the Kelvin sign onto "k"), so the case-insensitive gate is
+        # only applied to ASCII cells.
+        literal = _required_literal(query)
+        literal_lc = literal.lower() if literal else None
         
-        return matches
+        def _match_regex(text: str, text_lower: Optional[str] = None) -> List[Tuple[str, int, int]]:
+            if not text.isascii():
+                if case_sensitive and literal and literal not in text:
+                    return []
+                finditer = unicode_pattern.finditer(text)
+            elif case_sensitive:
+                if literal and literal not in text:
+                    return []
+                finditer = pattern.finditer(text)
+            else:
+                text_lc = text.lower()
+                if literal_lc and literal_lc not in text_lc:
+                    return []
+                if folded is not None:
+                    finditer = folded.finditer(text_lc)
+                else:
+                    finditer = pattern.finditer(text)
+            # Let the compiled SRE engine drive the match loop directly
+            return [(text[m.start():m.end()], m.start(), m.end()) for m in finditer]
+        return _match_regex
     
     def search_table_headers(
         self,
         file_path: str,
         query: str,
         search_mode: str = "contains",
-        case_sensitive: bool = False
+        case_sensitive: bool = False,
+        max_matches: Optional[int] = None
     ) -> OperationResponse:
         """
         Search specifically in table headers (first row of each table).
@@ -1082,6 +1811,8 @@ class TableOperations:
             query: Search query string
             search_mode: Search mode ("exact", "contains", "regex")
             case_sensitive: Whether search is case sensitive
+            max_matches: Stop scanning once this many matches are found
+                (None = no limit); the summary's "truncated" flag reports it
             
         Returns:
             OperationResponse with search results
@@ -1090,50 +1821,117 @@ class TableOperations:
             if not query.strip():
                 return OperationResponse.error("Search query cannot be empty")
             
-            document = self.document_manager.get_or_load_document(file_path)
+            if max_matches is not None and max_matches <= 0:
+                return OperationResponse.error("max_matches must be a positive integer")
+            
+            valid_modes = ["exact", "contains", "regex"]
+            if search_mode not in valid_modes:
+                return OperationResponse.error(f"Invalid search mode. Valid options: {', '.join(valid_modes)}")
+            
+            document = self.document_manager.get_cached_or_load(file_path)
             
-            matches = []
             tables_with_headers = 0
             
+            # Snapshot tables once; each python-docx accessor re-walks the XML
+            tables = list(document.tables)
+            n_tables = len(tables)
+            header_rows = []
+            for table_idx, table in enumerate(tables):
+                # Only the header row is needed, read straight from its <w:tc>s
+                first_row = _first_row_texts(table)
+                if first_row is not None:
+                    header_rows.append((table_idx, first_row))
+            
+            pattern = None
+            if search_mode == "regex":
+                try:
+                    pattern = _compile_search_pattern(query, case_sensitive)
+                except re.error as e:
+                    return OperationResponse.error(f"Invalid regex pattern: {str(e)}")
+            
+            # Dispatch on the search mode once rather than per cell
+            matcher_fn = self._make_matcher(query, search_mode, case_sensitive, pattern)
+            
+            # Cells shorter than the query cannot match in exact/contains mode.
+            # Lowercasing non-ASCII text may change its length, so the length
+            # check only applies to case-sensitive or ASCII comparisons.
+            nq = len(query) if search_mode != "regex" else 0
+            
+            # Case-insensitive exact and contains searches compare lowercased
+            # text; lower each header once and hand it to the matcher
+            lower_rows = None
+            if not case_sensitive and search_mode != "regex":
+                lower_rows = [
+                    [text.lower() for text in header_texts]
+                    for _, header_texts in header_rows
+                ]
+            
+            # In contains mode the hit count is known up front when the needle
+            # cannot overlap itself (str.count reports non-overlapping hits), so
+            # the result list can be sized exactly instead of grown by append.
+            matches = []
+            fill_idx = None
+            needle = query if case_sensitive else query.lower()
+            if search_mode == "contains" and _is_overlap_free(needle):
+                scan_rows = lower_rows if lower_rows is not None else [
+                    header_texts for _, header_texts in header_rows
+                ]
+                total = sum(
+                    text.count(needle)
+                    for header_texts in scan_rows
+                    for text in header_texts
+                )
+                if max_matches is not None:
+                    total = min(total, max_matches)
+                matches = [None] * total
+                fill_idx = 0
+            
+            found = 0
+            truncated = False
+            
             # Search only first row of each table
-            for table_idx, table in enumerate(document.tables):
-                if not table.rows:
-                    continue
-                
-                first_row = table.rows[0]
+            for row_idx, (table_idx, header_texts) in enumerate(header_rows):
                 has_header_matches = False
+                lower_texts = lower_rows[row_idx] if lower_rows is not None else None
                 
-                for col_idx, cell in enumerate(first_row.cells):
-                    cell_text = cell.text
-                    
-                    # Use the same search logic as general search
-                    pattern = None
-                    if search_mode == "regex":
-                        try:
-                            flags = 0 if case_sensitive else re.IGNORECASE
-                            pattern = re.compile(query, flags)
-                        except re.error as e:
-                            return OperationResponse.error(f"Invalid regex pattern: {str(e)}")
-                    
-                    cell_matches = self._search_cell_content(
-                        cell_text, query, search_mode, case_sensitive, pattern
-                    )
+                for col_idx, cell_text in enumerate(header_texts):
+                    if not cell_text:
+                        continue
+                    if len(cell_text) < nq and (case_sensitive or cell_text.isascii()):
+                        continue
                     
-                    for match_info in cell_matches:
+                    cell_lower = lower_texts[col_idx] if lower_texts is not None else None
+                    for match_text, match_start, match_end in matcher_fn(cell_text, cell_lower):
                         match = TableSearchMatch(
                             table_index=table_idx,
                             row_index=0,  # Always first row for headers
                             column_index=col_idx,
                             cell_value=cell_text,
-                            match_text=match_info["text"],
-                            match_start=match_info["start"],
-                            match_end=match_info["end"]
+                            match_text=match_text,
+                            match_start=match_start,
+                            match_end=match_end
                         )
-                        matches.append(match)
+                        if fill_idx is not None:
+                            matches[fill_idx] = match
+                            fill_idx += 1
+                        else:
+                            matches.append(match)
                         has_header_matches = True
+                        found += 1
+                        if max_matches is not None and found >= max_matches:
+                            truncated = True
+                            break
+                    
+                    if truncated:
+                        break
                 
                 if has_header_matches:
                     tables_with_headers += 1
+                if truncated:
+                    break
+            
+            if fill_idx is not None:
+                del matches[fill_idx:]
             
             # Create search result
             search_result = TableSearchResult(
@@ -1142,20 +1940,158 @@ class TableOperations:
                 case_sensitive=case_sensitive,
                 matches=matches,
                 total_matches=len(matches),
-                tables_searched=list(range(len(document.tables))),
+                tables_searched=list(range(n_tables)),
                 summary={
                     "search_type": "headers_only",
                     "tables_with_header_matches": tables_with_headers,
-                    "total_tables": len(document.tables)
+                    "total_tables": n_tables,
+                    "truncated": truncated
                 }
             )
             
             message = f"Found {len(matches)} header matches in {tables_with_headers} tables"
+            if truncated:
+                message += f" (limited to {max_matches} results)"
             return OperationResponse.success(message, search_result.to_dict())
             
         except Exception as e:
             return OperationResponse.error(f"Failed to search table headers: {str(e)}")
     
+    def search_table_headers_batch(
+        self,
+        file_path: str,
+        queries: List[str],
+        case_sensitive: bool = False
+    ) -> OperationResponse:
+        """
+        Search table headers for several queries in a single pass.
+        
+        Uses substring ("contains") matching. When the optional ``pyahocorasick``
+        package is installed, all queries are compiled into one Aho-Corasick
+        automaton so every header cell is scanned once regardless of the number
+        of queries; otherwise each query is located with ``str.find``.
+        
+        Args:
+            file_path: Path to the document
+            queries: List of search query strings
+            case_sensitive: Whether search is case sensitive
+            
+        Returns:
+            OperationResponse with one search result per query
+        """
+        try:
+            if not queries:
+                return OperationResponse.error("No search queries provided")
+            
+            for query in queries:
+                if not query.strip():
+                    return OperationResponse.error("Search query cannot be empty")
+            
+            document = self.document_manager.get_cached_or_load(file_path)
+            
+            # Map each distinct needle to the query positions that use it
+            needles: Dict[str, List[int]] = {}
+            for query_idx, query in enumerate(queries):
+                needle = query if case_sensitive else query.lower()
+                needles.setdefault(needle, []).append(query_idx)
+            
+            automaton = None
+            if ahocorasick is not None:
+                automaton = ahocorasick.Automaton()
+                for needle in needles:
+                    automaton.add_word(needle, needle)
+                automaton.make_automaton()
+            
+            shortest = min(len(needle) for needle in needles)
+            matches_per_query: List[List[TableSearchMatch]] = [[] for _ in queries]
+            tables_per_query: List[set] = [set() for _ in queries]
+            
+            tables = list(document.tables)
+            
+            # Scan only the first row of each table
+            for table_idx, table in enumerate(tables):
+                first_row = _first_row_texts(table)
+                if not first_row:
+                    continue
+                
+                for col_idx, cell_text in enumerate(first_row):
+                    if not cell_text:
+                        continue
+                    if len(cell_text) < shortest and (case_sensitive or cell_text.isascii()):
+                        continue
+                    search_text = cell_text if case_sensitive else cell_text.lower()
+                    
+                    if automaton is not None:
+                        hits = (
+                            (end_idx - len(needle) + 1, needle)
+                            for end_idx, needle in automaton.iter(search_text)
+                        )
+                    else:
+                        hits = self._find_all_needles(search_text, needles)
+                    
+                    for start, needle in hits:
+                        end = start + len(needle)
+                        for query_idx in needles[needle]:
+                            matches_per_query[query_idx].append(TableSearchMatch(
+                                table_index=table_idx,
+                                row_index=0,  # Always first row for headers
+                                column_index=col_idx,
+                                cell_value=cell_text,
+                                match_text=cell_text[start:end],
+                                match_start=start,
+                                match_end=end
+                            ))
+                            tables_per_query[query_idx].add(table_idx)
+            
+            total_tables = len(tables)
+            results = []
+            for query_idx, query in enumerate(queries):
+                matches = sorted(
+                    matches_per_query[query_idx],
+                    key=lambda m: (m.table_index, m.column_index, m.match_start)
+                )
+                search_result = TableSearchResult(
+                    query=query,
+                    search_mode="contains",
+                    case_sensitive=case_sensitive,
+                    matches=matches,
+                    total_matches=len(matches),
+                    tables_searched=list(range(total_tables)),
+                    summary={
+                        "search_type": "headers_only",
+                        "tables_with_header_matches": len(tables_per_query[query_idx]),
+                        "total_tables": total_tables
+                    }
+                )
+                results.append(search_result.to_dict())
+            
+            total_matches = sum(result["total_matches"] for result in results)
+            data = {
+                "queries": list(queries),
+                "case_sensitive": case_sensitive,
+                "total_matches": total_matches,
+                "results": results
+            }
+            
+            message = f"Found {total_matches} header matches for {len(queries)} queries"
+            return OperationResponse.success(message, data)
+            
+        except Exception as e:
+            return OperationResponse.error(f"Failed to search table headers: {str(e)}")
+    
+    def _find_all_needles(self, search_text: str, needles: Dict[str, List[int]]):
+        """
+        Yield (start, needle) for every occurrence of each needle in the text.
+        
+        Fallback for search_table_headers_batch when pyahocorasick is unavailable.
+        Overlapping occurrences are reported, matching the "contains" search mode.
+        """
+        for needle in needles:
+            start = search_text.find(needle)
+            while start != -1:
+                yield start, needle
+                start = search_text.find(needle, start + 1)
+    
     def analyze_table_structure(
         self,
         file_path: str,
@@ -1174,82 +2110,125 @@ class TableOperations:
             OperationResponse with comprehensive table analysis
         """
         try:
-            document = self.document_manager.get_or_load_document(file_path)
+            document = self.document_manager.get_cached_or_load(file_path)
             
             validate_table_index(table_index, len(document.tables))
             table = document.tables[table_index]
             
-            # Basic table information
-            total_rows = len(table.rows)
-            total_columns = len(table.columns) if table.rows else 0
+            table_analysis = self._analyze_table(table, table_index, include_cell_details)
             
-            # Table-level properties
-            table_style_name = getattr(table.style, 'name', None) if table.style else None
+            return OperationResponse.success(
+                f"Table {table_index} structure analyzed successfully",
+                table_analysis.to_dict()
+            )
             
-            # Header detection
-            has_header_row = False
-            header_row_index = None
-            header_cells = None
+        except (InvalidTableIndexError,) as e:
+            return OperationResponse.error(str(e))
+        except Exception as e:
+            return OperationResponse.error(f"Failed to analyze table structure: {str(e)}")
+    
+    def _analyze_table(
+        self,
+        table: Table,
+        table_index: int,
+        include_cell_details: bool,
+        keep_cells: bool = True
+    ) -> TableStructureAnalysis:
+        """
+        Analyze the structure and styling of an already loaded table.
+        
+        Args:
+            table: Table to analyze
+            table_index: Index of the table in its document
+            include_cell_details: Whether to include detailed cell analysis
+            keep_cells: Whether to return per-cell analyses and merge regions;
+                when False only the table-level summary fields are filled in
             
-            if table.rows:
-                # Simple heuristic: if first row has text in all cells, consider it header
-                first_row = table.rows[0]
-                first_row_texts = [cell.text.strip() for cell in first_row.cells]
-                has_header_row = all(text for text in first_row_texts)
+        Returns:
+            TableStructureAnalysis for the table
+        """
+        # Walk the table XML once into a grid of shared cells for the header
+        # check and the cell loop; table.rows and row.cells would rebuild
+        # their proxies on every access
+        rows_cells = _table_cell_grid(table)
+        
+        # Basic table information
+        total_rows = len(rows_cells)
+        total_columns = len(table.columns) if rows_cells else 0
+        
+        # Table-level properties
+        table_style_name = getattr(table.style, 'name', None) if table.style else None
+        
+        # Header detection
+        has_header_row = False
+        header_row_index = None
+        header_cells = None
+        
+        text_cache: Dict[Any, str] = {}
+        if rows_cells:
+            # Simple heuristic: if first row has text in all cells, consider it
+            # header. Stop at the first blank cell; only header texts get stripped.
+            first_row_texts = []
+            for cell in rows_cells[0]:
+                text = _cached_cell_text(cell, text_cache)
+                if not text or text.isspace():
+                    break
+                first_row_texts.append(text.strip())
+            else:
+                has_header_row = True
+                header_row_index = 0
+                header_cells = first_row_texts
+        
+        # Initialize cell analysis storage
+        cells = []
+        merge_regions = []
+        merged_cells_count = 0
+        
+        # Formatting of each distinct cell, reduced to style sets after the loop.
+        # A summary without per-cell results reads the style values for the
+        # whole table in one XPath pass instead.
+        cell_formats: List[Dict[str, Any]] = []
+        table_styles = None
+        if include_cell_details and not keep_cells:
+            table_styles = extract_table_style_values(table._tbl)
+        
+        # A merged region yields the same <w:tc> at every grid position it
+        # covers; analyze it once and reuse the result for the repeats
+        analyzed: Dict[Any, Tuple[Optional[MergeInfo], Optional[CellStyleAnalysis]]] = {}
+        
+        # Analyze each cell
+        for row_idx, row_cells in enumerate(rows_cells):
+            cell_row = []
+            for col_idx, cell in enumerate(row_cells):
+                tc = cell._tc
+                seen = analyzed.get(tc)
+                if seen is not None:
+                    merge_info, previous = seen
+                    if merge_info:
+                        merged_cells_count += 1
+                    if previous is not None:
+                        cell_row.append(replace(previous, row_index=row_idx, column_index=col_idx))
+                    continue
                 
-                if has_header_row:
-                    header_row_index = 0
-                    header_cells = first_row_texts
-            
-            # Initialize cell analysis storage
-            cells = []
-            merge_regions = []
-            merged_cells_count = 0
-            
-            # Style tracking for consistency analysis
-            font_families = set()
-            font_sizes = set()
-            colors = set()
-            background_colors = set()
-            alignments = set()
-            border_styles = set()
-            
-            # Analyze each cell
-            for row_idx, row in enumerate(table.rows):
-                cell_row = []
-                for col_idx, cell in enumerate(row.cells):
+                # Analyze merge information
+                merge_info = analyze_cell_merge(cell, row_idx, col_idx)
+                if merge_info:
+                    merge_regions.append(merge_info)
+                    merged_cells_count += 1
+                
+                # Extract formatting if detailed analysis is requested
+                formatting = None
+                if include_cell_details and table_styles is None:
+                    formatting = extract_cell_formatting(cell)
+                    cell_formats.append(formatting)
+                
+                cell_analysis = None
+                if keep_cells:
                     # Extract cell content
-                    text_content = cell.text
+                    text_content = _cached_cell_text(cell, text_cache)
                     is_empty = not text_content.strip()
                     
-                    # Analyze merge information
-                    merge_info = analyze_cell_merge(cell, row_idx, col_idx)
-                    if merge_info:
-                        merge_regions.append(merge_info)
-                        merged_cells_count += 1
-                    
-                    # Extract formatting if detailed analysis is requested
-                    cell_analysis = None
-                    if include_cell_details:
-                        formatting = extract_cell_formatting(cell)
-                        
-                        # Track unique styles
-                        if formatting["font_family"]:
-                            font_families.add(formatting["font_family"])
-                        if formatting["font_size"]:
-                            font_sizes.add(formatting["font_size"])
-                        if formatting["font_color"]:
-                            colors.add(formatting["font_color"])
-                        if formatting["background_color"]:
-                            background_colors.add(formatting["background_color"])
-                        if formatting["horizontal_alignment"]:
-                            alignments.add(formatting["horizontal_alignment"])
-                        
-                        # Track border styles
-                        for border_side, border_info in formatting["borders"].items():
-                            if border_info and border_info.get("style"):
-                                border_styles.add(border_info["style"])
-                        
+                    if formatting is not None:
                         cell_analysis = CellStyleAnalysis(
                             row_index=row_idx,
                             column_index=col_idx,
@@ -1298,48 +2277,60 @@ class TableOperations:
                             width=None,
                             height=None
                         )
-                    
                     cell_row.append(cell_analysis)
                 
-                cells.append(cell_row)
-            
-            # Style consistency analysis
-            consistent_fonts = len(font_families) <= 1
-            consistent_alignment = len(alignments) <= 1
-            consistent_borders = len(border_styles) <= 1
-            
-            # Create table structure analysis
-            table_analysis = TableStructureAnalysis(
-                table_index=table_index,
-                total_rows=total_rows,
-                total_columns=total_columns,
-                table_style_name=table_style_name,
-                table_alignment=None,  # Could be implemented if needed
-                table_width=None,      # Could be implemented if needed
-                has_header_row=has_header_row,
-                header_row_index=header_row_index,
-                header_cells=header_cells,
-                cells=cells,
-                merged_cells_count=merged_cells_count,
-                merge_regions=merge_regions,
-                consistent_fonts=consistent_fonts,
-                consistent_alignment=consistent_alignment,
-                consistent_borders=consistent_borders,
-                unique_font_families=list(font_families),
-                unique_font_sizes=list(font_sizes),
-                unique_colors=list(colors),
-                unique_background_colors=list(background_colors)
-            )
-            
-            return OperationResponse.success(
-                f"Table {table_index} structure analyzed successfully",
-                table_analysis.to_dict()
-            )
+                analyzed[tc] = (merge_info, cell_analysis)
             
-        except (InvalidTableIndexError,) as e:
-            return OperationResponse.error(str(e))
-        except Exception as e:
-            return OperationResponse.error(f"Failed to analyze table structure: {str(e)}")
+            if keep_cells:
+                cells.append(cell_row)
+        
+        # Track unique styles
+        if table_styles is not None:
+            font_families = table_styles["font_families"]
+            font_sizes = table_styles["font_sizes"]
+            colors = table_styles["colors"]
+            background_colors = table_styles["background_colors"]
+            alignments = table_styles["alignments"]
+            border_styles = table_styles["border_styles"]
+        else:
+            font_families = {f["font_family"] for f in cell_formats if f["font_family"]}
+            font_sizes = {f["font_size"] for f in cell_formats if f["font_size"]}
+            colors = {f["font_color"] for f in cell_formats if f["font_color"]}
+            background_colors = {f["background_color"] for f in cell_formats if f["background_color"]}
+            alignments = {f["horizontal_alignment"] for f in cell_formats if f["horizontal_alignment"]}
+            border_styles = {
+                border_info["style"]
+                for f in cell_formats
+                for border_info in f["borders"].values()
+                if border_info and border_info.get("style")
+            }
+        
+        # Style consistency analysis
+        consistent_fonts = len(font_families) <= 1
+        consistent_alignment = len(alignments) <= 1
+        consistent_borders = len(border_styles) <= 1
+        
+        return TableStructureAnalysis(
+            table_index=table_index,
+            total_rows=total_rows,
+            total_columns=total_columns,
+            table_style_name=table_style_name,
+            table_alignment=None,  # Could be implemented if needed
+            table_width=None,      # Could be implemented if needed
+            has_header_row=has_header_row,
+            header_row_index=header_row_index,
+            header_cells=header_cells,
+            cells=cells,
+            merged_cells_count=merged_cells_count,
+            merge_regions=merge_regions if keep_cells else [],
+            consistent_fonts=consistent_fonts,
+            consistent_alignment=consistent_alignment,
+            consistent_borders=consistent_borders,
+            unique_font_families=list(font_families),
+            unique_font_sizes=list(font_sizes),
+            unique_colors=list(colors),
+            unique_background_colors=list(background_colors)
+        )
     
     def analyze_all_tables(
         self,
@@ -1359,9 +2350,10 @@ class TableOperations:
         try:
             from datetime import datetime
             
-            document = self.document_manager.get_or_load_document(file_path)
+            document = self.document_manager.get_cached_or_load(file_path)
+            tables = document.tables
             
-            if not document.tables:
+            if not tables:
                 return OperationResponse.success(
                     "No tables found in document",
                     {"file_path": file_path, "total_tables": 0, "tables": []}
@@ -1369,39 +2361,19 @@ class TableOperations:
             
             table_analyses = []
             
-            # Analyze each table
-            for table_idx in range(len(document.tables)):
-                analysis_response = self.analyze_table_structure(
-                    file_path, table_idx, include_cell_details
-                )
-                
-                if analysis_response.success:
-                    # Extract the table analysis from the response data
-                    table_data = analysis_response.data
-                    table_analyses.append(TableStructureAnalysis(
-                        table_index=table_data["table_info"]["index"],
-                        total_rows=table_data["table_info"]["rows"],
-                        total_columns=table_data["table_info"]["columns"],
-                        table_style_name=table_data["table_info"]["style_name"],
-                        table_alignment=table_data["table_info"]["alignment"],
-                        table_width=table_data["table_info"]["width"],
-                        has_header_row=table_data["header_info"]["has_header"],
-                        header_row_index=table_data["header_info"]["header_row_index"],
-                        header_cells=table_data["header_info"]["header_cells"],
-                        cells=[],  # We'll populate this if needed
-                        merged_cells_count=table_data["merge_analysis"]["merged_cells_count"],
-                        merge_regions=[],  # We'll populate this if needed
-                        consistent_fonts=table_data["style_consistency"]["fonts"],
-                        consistent_alignment=table_data["style_consistency"]["alignment"],
-                        consistent_borders=table_data["style_consistency"]["borders"],
-                        unique_font_families=table_data["style_summary"]["font_families"],
-                        unique_font_sizes=table_data["style_summary"]["font_sizes"],
-                        unique_colors=table_data["style_summary"]["colors"],
-                        unique_background_colors=table_data["style_summary"]["background_colors"]
-                    ))
-                else:
-                    # If individual table analysis fails, log it but continue
+            # Analyze the loaded tables directly rather than through
+            # analyze_table_structure, which would reload the document, rebuild
+            # document.tables and round-trip every analysis through to_dict()
+            for table_idx, table in enumerate(tables):
+                try:
+                    # The summary omits per-cell detail and merge regions
+                    analysis = self._analyze_table(
+                        table, table_idx, include_cell_details, keep_cells=False
+                    )
+                except Exception:
+                    # If individual table analysis fails, skip it but continue
                     continue
+                table_analyses.append(analysis)
             
             # Create comprehensive analysis result
             analysis_result = TableAnalysisResult(
@@ -1421,7 +2393,8 @@ class TableOperations:
     
     def _apply_row_styling(
         self, 
-        new_rows, 
+        table,
+        new_trs, 
         reference_row, 
         default_text_format, 
         default_alignment, 
@@ -1431,33 +2404,43 @@ class TableOperations:
         Apply styling to newly added rows.
         
         Args:
-            new_rows: List of newly created row objects
+            table: Table the rows were added to
+            new_trs: List of newly created <w:tr> elements
             reference_row: Row to copy style from (if provided)
             default_text_format: Default text formatting
             default_alignment: Default alignment
             default_background_color: Default background color
         """
+        # row.cells re-expands the row on each access, so read the reference once
+        reference_cells = reference_row.cells if reference_row else ()
+        n_reference = len(reference_cells)
+        
+        # Parse colors, sizes and alignments once for all new cells
+        plan = None
+        if default_text_format or default_alignment or default_background_color:
+            plan = _CellStylePlan(default_text_format, default_alignment, default_background_color)
+            if plan.is_empty():
+                plan = None
         
-        for new_row in new_rows:
-            # Apply styling to each cell in the new row
-            for col_idx, new_cell in enumerate(new_row.cells):
+        for tr in new_trs:
+            # Apply styling to each cell in the new row. add_row() gives every
+            # grid column its own unmerged <w:tc>, so the cells can be wrapped
+            # straight from tc_lst instead of re-expanding the row via row.cells.
+            for col_idx, tc in enumerate(tr.tc_lst):
+                new_cell = _Cell(tc, table)
+                
                 # Determine reference cell for style copying
                 reference_cell = None
-                if reference_row and col_idx < len(reference_row.cells):
-                    reference_cell = reference_row.cells[col_idx]
+                if col_idx < n_reference:
+                    reference_cell = reference_cells[col_idx]
                 
                 # Copy style from reference cell if available
                 if reference_cell:
                     self._copy_cell_style(new_cell, reference_cell)
                 
                 # Apply default formatting if no reference or to override
-                if default_text_format or default_alignment or default_background_color:
-                    self._apply_default_cell_formatting(
-                        new_cell, 
-                        default_text_format, 
-                        default_alignment, 
-                        default_background_color
-                    )
+                if plan is not None:
+                    self._apply_default_cell_formatting(new_cell, plan)
     
     def _copy_cell_style(self, target_cell, source_cell):
         """
@@ -1474,166 +2457,89 @@ class TableOperations:
                 target_para.alignment = source_para.alignment
                 
                 # Copy run formatting
-                if source_para.runs:
-                    # Clear existing runs in target
-                    for run in target_para.runs:
-                        run._element.getparent().remove(run._element)
-                    
-                    # Copy runs from source
-                    for source_run in source_para.runs:
-                        new_run = target_para.add_run("")
-                        
-                        # Copy font properties
-                        if source_run.font.name:
-                            new_run.font.name = source_run.font.name
-                        if source_run.font.size:
-                            new_run.font.size = source_run.font.size
-                        if source_run.font.color.rgb:
-                            new_run.font.color.rgb = source_run.font.color.rgb
-                        
-                        new_run.bold = source_run.bold
-                        new_run.italic = source_run.italic
-                        new_run.underline = source_run.underline
-            
-            # Copy cell background color
-            try:
-                source_shading = source_cell._element.find('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}shd')
-                if source_shading is not None:
-                    target_shading = target_cell._element.find('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}shd')
-                    if target_shading is None:
-                        # Create shading element
-                        target_shading = OxmlElement('w:shd')
-                        target_cell._element.get_or_add_tcPr().append(target_shading)
-                    
-                    # Copy fill attribute
-                    if source_shading.get(qn('w:fill')):
-                        target_shading.set(qn('w:fill'), source_shading.get(qn('w:fill')))
-            except Exception:
-                pass  # Ignore background color copy errors
-            
-            # Copy cell vertical alignment
-            try:
-                source_valign = source_cell._element.find('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}vAlign')
-                if source_valign is not None:
-                    target_valign = target_cell._element.find('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}vAlign')
-                    if target_valign is None:
-                        target_valign = OxmlElement('w:vAlign')
-                        target_cell._element.get_or_add_tcPr().append(target_valign)
-                    target_valign.set(qn('w:val'), source_valign.get(qn('w:val')))
-            except Exception:
-                pass  # Ignore vertical alignment copy errors
-            
-            # Copy cell borders
-            try:
-                ns = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
-                source_borders = source_cell._element.find(f'.//{{{ns}}}tcBorders')
-                if source_borders is not None:
-                    # Get or create target tcPr
-                    target_tcPr = target_cell._element.get_or_add_tcPr()
-                    
-                    # Remove existing borders
-                    existing_borders = target_tcPr.find(f'.//{{{ns}}}tcBorders')
-                    if existing_borders is not None:
-                        target_tcPr.remove(existing_borders)
+                source_runs = source_para._p.findall(_QN_R)
+                if source_runs:
+                    # Clear existing runs in target straight from the <w:p>
+                    target_p = target_para._p
+                    for r in target_p.findall(_QN_R):
+                        target_p.remove(r)
                     
-                    # Clone the entire tcBorders element
-                    import copy
-                    new_borders = copy.deepcopy(source_borders)
-                    target_tcPr.append(new_borders)
-            except Exception:
-                pass  # Ignore border copy errors
+                    # Add one empty run per source run carrying a clone of its
+                    # <w:rPr>; the source text is deliberately not copied
+                    for source_r in source_runs:
+                        new_r = target_p.add_r()
+                        source_rPr = source_r.find(_QN_RPR)
+                        if source_rPr is not None:
+                            new_r.insert(0, copy(source_rPr))
+            
+            # Copy cell-level styles (shading, borders, vertical alignment,
+            # margins, ...) by cloning the source's whole <w:tcPr> in one go
+            source_tcPr = source_cell._element.tcPr
+            if source_tcPr is not None:
+                _replace_tc_pr(target_cell._element, source_tcPr)
                 
         except Exception as e:
             # If copying fails, just continue - better to have unstyled cells than no cells
             pass
     
-    def _apply_default_cell_formatting(
-        self, 
-        cell, 
-        text_format, 
-        alignment, 
-        background_color
-    ):
+    def _apply_default_cell_formatting(self, cell, plan: _CellStylePlan):
         """
         Apply default formatting to a cell.
         
         Args:
             cell: Cell to format
-            text_format: TextFormat object with formatting
-            alignment: CellAlignment object with alignment
-            background_color: Background color as hex string
+            plan: Default text format, alignment and background, pre-resolved
         """
         try:
-            # Apply text formatting
-            if text_format:
+            # Apply text formatting and horizontal alignment in one paragraph walk
+            if plan.has_text_format or plan.h_align is not None:
                 for paragraph in cell.paragraphs:
-                    if not paragraph.runs:
-                        paragraph.add_run("")
+                    if plan.h_align is not None:
+                        paragraph.alignment = plan.h_align
                     
-                    for run in paragraph.runs:
-                        if text_format.font_family:
-                            run.font.name = text_format.font_family
-                        if text_format.font_size:
-                            run.font.size = Pt(text_format.font_size)
-                        if text_format.font_color:
-                            # Parse hex color
-                            try:
-                                color_hex = text_format.font_color.lstrip('#')
-                                if len(color_hex) == 6:
-                                    r = int(color_hex[0:2], 16)
-                                    g = int(color_hex[2:4], 16)
-                                    b = int(color_hex[4:6], 16)
-                                    run.font.color.rgb = RGBColor(r, g, b)
-                            except Exception:
-                                pass
-                        
-                        if text_format.bold is not None:
-                            run.bold = text_format.bold
-                        if text_format.italic is not None:
-                            run.italic = text_format.italic
-                        if text_format.underline is not None:
-                            run.underline = text_format.underline
-            
-            # Apply alignment
-            if alignment:
-                for paragraph in cell.paragraphs:
-                    if alignment.horizontal:
-                        alignment_map = {
-                            'left': WD_ALIGN_PARAGRAPH.LEFT,
-                            'center': WD_ALIGN_PARAGRAPH.CENTER,
-                            'right': WD_ALIGN_PARAGRAPH.RIGHT,
-                            'justify': WD_ALIGN_PARAGRAPH.JUSTIFY
-                        }
-                        if alignment.horizontal.lower() in alignment_map:
-                            paragraph.alignment = alignment_map[alignment.horizontal.lower()]
-                
-                # Apply vertical alignment
-                if alignment.vertical:
-                    try:
-                        v_align = alignment.vertical.lower()
-                        if v_align == 'middle':
-                            v_align = 'center'
+                    if not plan.has_text_format:
+                        continue
+                    
+                    runs = paragraph.runs
+                    if not runs:
+                        runs = [paragraph.add_run("")]
+                    
+                    for run in runs:
+                        font = run.font
+                        if plan.font_family:
+                            font.name = plan.font_family
+                        if plan.font_size is not None:
+                            font.size = plan.font_size
+                        if plan.rgb is not None:
+                            font.color.rgb = plan.rgb
                         
-                        valign_element = cell._element.find('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}vAlign')
-                        if valign_element is None:
-                            valign_element = OxmlElement('w:vAlign')
-                            cell._element.get_or_add_tcPr().append(valign_element)
-                        valign_element.set(qn('w:val'), v_align)
-                    except Exception:
-                        pass
-            
-            # Apply background color
-            if background_color:
-                try:
-                    color_hex = background_color.lstrip('#').upper()
-                    if len(color_hex) == 6:
-                        shading = cell._element.find('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}shd')
-                        if shading is None:
-                            shading = OxmlElement('w:shd')
-                            cell._element.get_or_add_tcPr().append(shading)
-                        shading.set(qn('w:fill'), color_hex)
-                except Exception:
-                    pass
+                        if plan.bold is not None:
+                            run.bold = plan.bold
+                        if plan.italic is not None:
+                            run.italic = plan.italic
+                        if plan.underline is not None:
+                            run.underline = plan.underline
+            
+            # Look the cell's tcPr up once for both the alignment and the fill
+            tc_pr = None
+            if plan.v_align or plan.fill is not None:
+                tc_pr = cell._element.get_or_add_tcPr()
+            
+            # Apply vertical alignment; the plan already normalized the value
+            if plan.v_align:
+                valign_element = _find_child(tc_pr, _QN_VALIGN)
+                if valign_element is None:
+                    valign_element = copy(_VALIGN_TEMPLATE)
+                    tc_pr.append(valign_element)
+                valign_element.set(_QN_VAL, plan.v_align)
+            
+            # Apply background color; the plan already validated the hex digits
+            if plan.fill is not None:
+                shading = _find_child(tc_pr, _QN_SHD)
+                if shading is None:
+                    shading = copy(_SHD_TEMPLATE)
+                    tc_pr.append(shading)
+                shading.set(_QN_FILL, plan.fill)
                     
         except Exception as e:
             # If formatting fails, continue - better to have unformatted cells than no cells
@@ -1649,17 +2555,5 @@ class TableOperations:
         Returns:
             Border data in expected format for get_cell_value
         """
-        result = {}
-        
-        for side in ['top', 'bottom', 'left', 'right']:
-            border_info = borders_dict.get(side, {})
-            if border_info:
-                result[f'{side}_style'] = border_info.get('style')
-                result[f'{side}_width'] = border_info.get('width')
-                result[f'{side}_color'] = border_info.get('color')
-            else:
-                result[f'{side}_style'] = None
-                result[f'{side}_width'] = None
-                result[f'{side}_color'] = None
-        
-        return result
+        sides = {side: borders_dict.get(side) or {} for side in ('top', 'bottom', 'left', 'right')}
+        return {key: sides[side].get(attr) for key, side, attr in _BORDER_KEYS}
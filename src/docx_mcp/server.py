@@ -1,20 +1,114 @@
 """MCP Server for Word document operations using FastMCP."""
 
-from typing import Any, Dict, List
+import asyncio
+import os
+from contextlib import AsyncExitStack, asynccontextmanager
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 from fastmcp import FastMCP
 
-from .core.document_manager import DocumentManager
-from .operations.tables.table_operations import TableOperations
 from .models.responses import OperationResponse
-from .models.formatting import TextFormat, CellAlignment, CellBorders, CellFormatting
+from .models.formatting import (
+    TextFormat, CellAlignment, CellBorders, CellFormatting,
+    TextFormatDict, CellBordersDict
+)
+
+if TYPE_CHECKING:
+    from .core.document_manager import DocumentManager
+    from .operations.tables.table_operations import TableOperations
 
 
 # Initialize FastMCP app
 mcp = FastMCP("Word Document MCP Server")
 
-# Initialize managers
-document_manager = DocumentManager()
-table_operations = TableOperations(document_manager)
+
+# Managers are created on first use: importing them pulls in python-docx and
+# lxml, which would otherwise be paid on every server start, including stdio
+# launches that only list the tools.
+@lru_cache(maxsize=None)
+def _get_document_manager() -> "DocumentManager":
+    from .core.document_manager import DocumentManager
+    return DocumentManager()
+
+
+@lru_cache(maxsize=None)
+def _get_table_operations() -> "TableOperations":
+    from .operations.tables.table_operations import TableOperations
+    return TableOperations(_get_document_manager())
+
+
+# Tool calls run in a worker thread: parsing, editing and saving a document is
+# blocking work, and keeping it off the event loop lets the server go on
+# answering other sessions' requests. A python-docx document is not
+# thread-safe, so calls on the same file take that file's lock and run one at
+# a time, while calls on different files run side by side. Locks are keyed by
+# the resolved path, so different spellings of one file share a lock, and
+# are created on first use so they bind to the running loop. Each entry
+# counts the calls holding or waiting for its lock and is dropped when the
+# last one finishes, so the table only holds files with calls in flight.
+_file_locks: Dict[str, List[Any]] = {}
+
+
+@asynccontextmanager
+async def _locked_files(*file_paths: Optional[str]) -> AsyncIterator[None]:
+    """Hold the locks of one or more documents, taken in a fixed order."""
+    keys = sorted({os.path.realpath(path) for path in file_paths if path})
+    entries = []
+    for key in keys:
+        entry = _file_locks.get(key)
+        if entry is None:
+            entry = _file_locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        entries.append((key, entry))
+    try:
+        async with AsyncExitStack() as stack:
+            for _, entry in entries:
+                await stack.enter_async_context(entry[0])
+            yield
+    finally:
+        for key, entry in entries:
+            entry[1] -= 1
+            if not entry[1]:
+                del _file_locks[key]
+
+
+async def _run_locked(
+    file_paths: Tuple[Optional[str], ...],
+    func: Callable[..., OperationResponse],
+    *args: Any,
+    **kwargs: Any
+) -> OperationResponse:
+    """Run a blocking operation in the default executor while holding the documents' locks."""
+    async with _locked_files(*file_paths):
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(None, partial(func, *args, **kwargs))
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # The worker thread cannot be stopped, so keep holding the locks
+            # until the operation has finished before passing on the cancel
+            while not future.done():
+                try:
+                    await asyncio.wait({future})
+                except asyncio.CancelledError:
+                    pass
+            raise
+
+
+async def _run_blocking(
+    func: Callable[..., OperationResponse], file_path: str, *args: Any, **kwargs: Any
+) -> OperationResponse:
+    """Run a blocking operation on a document in the default executor."""
+    return await _run_locked((file_path,), func, file_path, *args, **kwargs)
+
+
+def __getattr__(name: str) -> Any:
+    """Expose the shared managers as module attributes, creating them on first access."""
+    if name == "document_manager":
+        return _get_document_manager()
+    if name == "table_operations":
+        return _get_table_operations()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Note: FastMCP automatically handles JSON parameter validation and conversion
@@ -23,7 +117,7 @@ table_operations = TableOperations(document_manager)
 
 # Document operations
 @mcp.tool()
-def open_document(
+async def open_document(
     file_path: str,
     create_if_not_exists: bool = True
 ) -> Dict[str, Any]:
@@ -33,7 +127,8 @@ def open_document(
         file_path: Path to the document file
         create_if_not_exists: Create document if it doesn't exist
     """
-    result = document_manager.open_document(
+    result = await _run_blocking(
+        _get_document_manager().open_document,
         file_path,
         create_if_not_exists
     )
@@ -41,7 +136,7 @@ def open_document(
 
 
 @mcp.tool()
-def save_document(
+async def save_document(
     file_path: str,
     save_as: str = None
 ) -> Dict[str, Any]:
@@ -51,7 +146,10 @@ def save_document(
         file_path: Path to the document file
         save_as: Optional path to save as a different file
     """
-    result = document_manager.save_document(
+    # Saving under a new name also replaces that file, so hold its lock too
+    result = await _run_locked(
+        (file_path, save_as),
+        _get_document_manager().save_document,
         file_path,
         save_as
     )
@@ -59,19 +157,19 @@ def save_document(
 
 
 @mcp.tool()
-def get_document_info(file_path: str) -> Dict[str, Any]:
+async def get_document_info(file_path: str) -> Dict[str, Any]:
     """Get information about a document.
     
     Args:
         file_path: Path to the document file
     """
-    result = document_manager.get_document_info(file_path)
+    result = await _run_blocking(_get_document_manager().get_document_info, file_path)
     return result.to_dict()
 
 
 # Table structure operations
 @mcp.tool()
-def create_table(
+async def create_table(
     file_path: str,
     rows: int,
     cols: int,
@@ -89,7 +187,8 @@ def create_table(
         paragraph_index: Paragraph index for after_paragraph position
         headers: Optional header row data
     """
-    result = table_operations.create_table(
+    result = await _run_blocking(
+        _get_table_operations().create_table,
         file_path,
         rows,
         cols,
@@ -101,7 +200,7 @@ def create_table(
 
 
 @mcp.tool()
-def delete_table(
+async def delete_table(
     file_path: str,
     table_index: int
 ) -> Dict[str, Any]:
@@ -111,7 +210,8 @@ def delete_table(
         file_path: Path to the document file
         table_index: Index of the table to delete (>= 0)
     """
-    result = table_operations.delete_table(
+    result = await _run_blocking(
+        _get_table_operations().delete_table,
         file_path,
         table_index
     )
@@ -119,7 +219,7 @@ def delete_table(
 
 
 @mcp.tool()
-def add_table_rows(
+async def add_table_rows(
     file_path: str,
     table_index: int,
     count: int = 1,
@@ -175,7 +275,8 @@ def add_table_rows(
             vertical=vertical_alignment
         )
     
-    result = table_operations.add_table_rows(
+    result = await _run_blocking(
+        _get_table_operations().add_table_rows,
         file_path,
         table_index,
         count,
@@ -190,7 +291,7 @@ def add_table_rows(
 
 
 @mcp.tool()
-def add_table_columns(
+async def add_table_columns(
     file_path: str,
     table_index: int,
     count: int = 1,
@@ -206,7 +307,8 @@ def add_table_columns(
         position: Position to add columns ("end", "beginning", "at_index")
         column_index: Column index for at_index position
     """
-    result = table_operations.add_table_columns(
+    result = await _run_blocking(
+        _get_table_operations().add_table_columns,
         file_path,
         table_index,
         count,
@@ -217,7 +319,7 @@ def add_table_columns(
 
 
 @mcp.tool()
-def delete_table_rows(
+async def delete_table_rows(
     file_path: str,
     table_index: int,
     row_indices: List[int]
@@ -229,7 +331,8 @@ def delete_table_rows(
         table_index: Index of the table (>= 0)
         row_indices: List of row indices to delete
     """
-    result = table_operations.delete_table_rows(
+    result = await _run_blocking(
+        _get_table_operations().delete_table_rows,
         file_path,
         table_index,
         row_indices
@@ -239,7 +342,7 @@ def delete_table_rows(
 
 # Data operations
 @mcp.tool()
-def set_cell_value(
+async def set_cell_value(
     file_path: str,
     table_index: int,
     row_index: int,
@@ -254,7 +357,8 @@ def set_cell_value(
     horizontal_alignment: str = None,
     vertical_alignment: str = None,
     background_color: str = None,
-    preserve_existing_format: bool = True
+    preserve_existing_format: bool = True,
+    return_applied_formatting: bool = True
 ) -> Dict[str, Any]:
     """Set the value and optional formatting of a specific cell.
     
@@ -278,6 +382,8 @@ def set_cell_value(
         vertical_alignment: Optional vertical alignment ("top", "middle", "bottom")
         background_color: Optional background color as hex string (e.g., "FFFF00" for yellow)
         preserve_existing_format: Whether to preserve existing formatting when not specified (default: True)
+        return_applied_formatting: Whether to re-read the cell to report its formatting (default: True);
+            when False the formatting that was written is reported instead
     """
     # Build text format if any text formatting is specified
     text_format = None
@@ -300,7 +406,8 @@ def set_cell_value(
         if vertical_alignment:
             alignment["vertical"] = vertical_alignment
     
-    result = table_operations.set_cell_value(
+    result = await _run_blocking(
+        _get_table_operations().set_cell_value,
         file_path,
         table_index,
         row_index,
@@ -309,13 +416,37 @@ def set_cell_value(
         text_format=text_format,
         alignment=alignment,
         background_color=background_color,
-        preserve_existing_format=preserve_existing_format
+        preserve_existing_format=preserve_existing_format,
+        return_applied_formatting=return_applied_formatting
     )
     return result.to_dict()
 
 
 @mcp.tool()
-def get_cell_value(
+async def set_cells(
+    file_path: str,
+    table_index: int,
+    updates: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Set the values and optional formatting of several cells in one table.
+    
+    Use this instead of repeated set_cell_value calls when filling a table.
+    
+    Args:
+        file_path: Path to the document file
+        table_index: Index of the table (>= 0)
+        updates: List of cell updates. Each needs row_index, column_index and value,
+            and may include any optional formatting parameter of set_cell_value
+            (font_family, font_size, font_color, bold, italic, underline,
+            horizontal_alignment, vertical_alignment, background_color,
+            preserve_existing_format)
+    """
+    result = await _run_blocking(_get_table_operations().set_cells, file_path, table_index, updates)
+    return result.to_dict()
+
+
+@mcp.tool()
+async def get_cell_value(
     file_path: str,
     table_index: int,
     row_index: int,
@@ -335,7 +466,8 @@ def get_cell_value(
         column_index: Column index (>= 0)
         include_formatting: Whether to include detailed formatting information (default: True)
     """
-    result = table_operations.get_cell_value(
+    result = await _run_blocking(
+        _get_table_operations().get_cell_value,
         file_path,
         table_index,
         row_index,
@@ -346,11 +478,12 @@ def get_cell_value(
 
 
 @mcp.tool()
-def get_table_data(
+async def get_table_data(
     file_path: str,
     table_index: int,
     include_headers: bool = True,
-    format: str = "array"
+    format: str = "array",
+    csv_as_list: bool = False
 ) -> Dict[str, Any]:
     """Get all data from a table.
     
@@ -359,19 +492,22 @@ def get_table_data(
         table_index: Index of the table (>= 0)
         include_headers: Whether to include headers
         format: Format of returned data ("array", "object", "csv")
+        csv_as_list: Return "csv" data as a list of rows instead of a CSV string
     """
-    result = table_operations.get_table_data(
+    result = await _run_blocking(
+        _get_table_operations().get_table_data,
         file_path,
         table_index,
         include_headers,
-        format
+        format,
+        csv_as_list
     )
     return result.to_dict()
 
 
 # Query operations
 @mcp.tool()
-def list_tables(
+async def list_tables(
     file_path: str,
     include_summary: bool = True
 ) -> Dict[str, Any]:
@@ -381,7 +517,8 @@ def list_tables(
         file_path: Path to the document file
         include_summary: Whether to include table summary information
     """
-    result = table_operations.list_tables(
+    result = await _run_blocking(
+        _get_table_operations().list_tables,
         file_path,
         include_summary
     )
@@ -390,7 +527,7 @@ def list_tables(
 
 # Table search operations
 @mcp.tool()
-def search_table_content(
+async def search_table_content(
     file_path: str,
     query: str,
     search_mode: str = "contains",
@@ -408,7 +545,8 @@ def search_table_content(
         table_indices: Optional list of table indices to search (None = all tables)
         max_results: Maximum number of results to return (None = no limit)
     """
-    result = table_operations.search_table_content(
+    result = await _run_blocking(
+        _get_table_operations().search_table_content,
         file_path,
         query,
         search_mode,
@@ -420,11 +558,12 @@ def search_table_content(
 
 
 @mcp.tool()
-def search_table_headers(
+async def search_table_headers(
     file_path: str,
     query: str,
     search_mode: str = "contains",
-    case_sensitive: bool = False
+    case_sensitive: bool = False,
+    max_matches: int = None
 ) -> Dict[str, Any]:
     """Search specifically in table headers (first row of each table).
     
@@ -433,11 +572,36 @@ def search_table_headers(
         query: Search query string
         search_mode: Search mode ("exact", "contains", "regex")
         case_sensitive: Whether search is case sensitive
+        max_matches: Stop after this many matches (None = no limit); results may be truncated
     """
-    result = table_operations.search_table_headers(
+    result = await _run_blocking(
+        _get_table_operations().search_table_headers,
         file_path,
         query,
         search_mode,
+        case_sensitive,
+        max_matches
+    )
+    return result.to_dict()
+
+
+@mcp.tool()
+async def search_table_headers_batch(
+    file_path: str,
+    queries: List[str],
+    case_sensitive: bool = False
+) -> Dict[str, Any]:
+    """Search table headers for several queries at once (substring matching).
+    
+    Args:
+        file_path: Path to the document file
+        queries: List of search query strings
+        case_sensitive: Whether search is case sensitive
+    """
+    result = await _run_blocking(
+        _get_table_operations().search_table_headers_batch,
+        file_path,
+        queries,
         case_sensitive
     )
     return result.to_dict()
@@ -445,18 +609,12 @@ def search_table_headers(
 
 # Cell formatting operations
 @mcp.tool()
-def format_cell_text(
+async def format_cell_text(
     file_path: str,
     table_index: int,
     row_index: int,
     column_index: int,
-    font_family: str = None,
-    font_size: int = None,
-    font_color: str = None,
-    bold: bool = None,
-    italic: bool = None,
-    underline: bool = None,
-    strikethrough: bool = None
+    text_format: TextFormatDict
 ) -> Dict[str, Any]:
     """Format text in a specific cell.
     
@@ -465,32 +623,19 @@ def format_cell_text(
         table_index: Index of the table (>= 0)
         row_index: Row index (>= 0)
         column_index: Column index (>= 0)
-        font_family: Font family name (e.g., "Arial", "Times New Roman")
-        font_size: Font size in points (8-72)
-        font_color: Font color as hex string (e.g., "FF0000" for red)
-        bold: Make text bold
-        italic: Make text italic
-        underline: Make text underlined
-        strikethrough: Make text strikethrough
+        text_format: Formatting to apply; any of "font_family" (e.g., "Arial"),
+            "font_size" (points, 8-72), "font_color" (hex, e.g., "FF0000"),
+            "bold", "italic", "underline", "strikethrough"
     """
-    text_format = TextFormat(
-        font_family=font_family,
-        font_size=font_size,
-        font_color=font_color,
-        bold=bold,
-        italic=italic,
-        underline=underline,
-        strikethrough=strikethrough
-    )
-    
-    result = table_operations.formatting.format_cell_text(
+    result = await _run_blocking(
+        _get_table_operations().formatting.format_cell_text,
         file_path, table_index, row_index, column_index, text_format
     )
     return result.to_dict()
 
 
 @mcp.tool()
-def format_cell_alignment(
+async def format_cell_alignment(
     file_path: str,
     table_index: int,
     row_index: int,
@@ -514,14 +659,15 @@ def format_cell_alignment(
     if vertical:
         alignment_dict["vertical"] = vertical
     
-    result = table_operations.formatting.format_cell_alignment(
+    result = await _run_blocking(
+        _get_table_operations().formatting.format_cell_alignment,
         file_path, table_index, row_index, column_index, alignment_dict
     )
     return result.to_dict()
 
 
 @mcp.tool()
-def format_cell_background(
+async def format_cell_background(
     file_path: str,
     table_index: int,
     row_index: int,
@@ -537,30 +683,20 @@ def format_cell_background(
         column_index: Column index (>= 0)
         color: Background color as hex string (e.g., "FFFF00" for yellow)
     """
-    result = table_operations.formatting.format_cell_background(
+    result = await _run_blocking(
+        _get_table_operations().formatting.format_cell_background,
         file_path, table_index, row_index, column_index, color
     )
     return result.to_dict()
 
 
 @mcp.tool()
-def format_cell_borders(
+async def format_cell_borders(
     file_path: str,
     table_index: int,
     row_index: int,
     column_index: int,
-    top_style: str = None,
-    top_width: str = None,
-    top_color: str = None,
-    bottom_style: str = None,
-    bottom_width: str = None,
-    bottom_color: str = None,
-    left_style: str = None,
-    left_width: str = None,
-    left_color: str = None,
-    right_style: str = None,
-    right_width: str = None,
-    right_color: str = None
+    borders: CellBordersDict
 ) -> Dict[str, Any]:
     """Set borders for a specific cell.
     
@@ -569,59 +705,21 @@ def format_cell_borders(
         table_index: Index of the table (>= 0)
         row_index: Row index (>= 0)
         column_index: Column index (>= 0)
-        top_style: Top border style ("solid", "dashed", "dotted", "double", "none")
-        top_width: Top border width ("thin", "medium", "thick")
-        top_color: Top border color as hex string
-        bottom_style: Bottom border style
-        bottom_width: Bottom border width
-        bottom_color: Bottom border color as hex string
-        left_style: Left border style
-        left_width: Left border width
-        left_color: Left border color as hex string
-        right_style: Right border style
-        right_width: Right border width
-        right_color: Right border color as hex string
+        borders: Sides to set ("top", "bottom", "left", "right"), each mapping to
+            {"style": "solid" | "dashed" | "dotted" | "double" | "none",
+             "width": "thin" | "medium" | "thick", "color": hex string};
+            missing keys default to a thin solid black border
     """
-    borders_dict = {}
-    
-    # Build border configuration
-    if any([top_style, top_width, top_color]):
-        borders_dict["top"] = {
-            "style": top_style or "solid",
-            "width": top_width or "thin",
-            "color": top_color or "000000"
-        }
-    
-    if any([bottom_style, bottom_width, bottom_color]):
-        borders_dict["bottom"] = {
-            "style": bottom_style or "solid",
-            "width": bottom_width or "thin",
-            "color": bottom_color or "000000"
-        }
-    
-    if any([left_style, left_width, left_color]):
-        borders_dict["left"] = {
-            "style": left_style or "solid",
-            "width": left_width or "thin",
-            "color": left_color or "000000"
-        }
-    
-    if any([right_style, right_width, right_color]):
-        borders_dict["right"] = {
-            "style": right_style or "solid",
-            "width": right_width or "thin",
-            "color": right_color or "000000"
-        }
-    
-    result = table_operations.formatting.format_cell_borders(
-        file_path, table_index, row_index, column_index, borders_dict
+    result = await _run_blocking(
+        _get_table_operations().formatting.format_cell_borders,
+        file_path, table_index, row_index, column_index, borders
     )
     return result.to_dict()
 
 
 # Table analysis operations
 @mcp.tool()
-def analyze_table_structure(
+async def analyze_table_structure(
     file_path: str,
     table_index: int,
     include_cell_details: bool = True
@@ -644,7 +742,8 @@ def analyze_table_structure(
         table_index: Index of the table to analyze (>= 0)
         include_cell_details: Whether to include detailed cell-level formatting analysis
     """
-    result = table_operations.analyze_table_structure(
+    result = await _run_blocking(
+        _get_table_operations().analyze_table_structure,
         file_path,
         table_index,
         include_cell_details
@@ -653,7 +752,7 @@ def analyze_table_structure(
 
 
 @mcp.tool()
-def analyze_all_tables_structure(
+async def analyze_all_tables_structure(
     file_path: str,
     include_cell_details: bool = True
 ) -> Dict[str, Any]:
@@ -675,7 +774,8 @@ def analyze_all_tables_structure(
         file_path: Path to the document file
         include_cell_details: Whether to include detailed cell-level formatting analysis
     """
-    result = table_operations.analyze_all_tables(
+    result = await _run_blocking(
+        _get_table_operations().analyze_all_tables,
         file_path,
         include_cell_details
     )
@@ -712,6 +812,14 @@ def main():
     
     args = parser.parse_args()
     
+    # Run the event loop on uvloop when the optional "fast" extra is installed
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     # Prepare transport kwargs for HTTP/SSE
     transport_kwargs = {}
     if args.transport in ["sse", "streamable-http"]:
@@ -31,18 +31,23 @@ def validate_file_path(file_path: str, must_exist: bool = True, max_size_mb: int
     """
     path = Path(file_path)
     
+    # One stat answers both the existence and the size check
+    try:
+        file_size = path.stat().st_size
+    except OSError:
+        file_size = None
+    
     # Check if file exists when required
-    if must_exist and not path.exists():
+    if must_exist and file_size is None:
         raise DocumentNotFoundError(f"Document not found: {file_path}")
     
     # Check file size if file exists
-    if path.exists():
-        file_size_mb = path.stat().st_size / (1024 * 1024)
-        if file_size_mb > max_size_mb:
-            raise FileSizeError(f"File size ({file_size_mb:.1f}MB) exceeds limit ({max_size_mb}MB)")
+    if file_size is not None and file_size > max_size_mb * 1024 * 1024:
+        file_size_mb = file_size / (1024 * 1024)
+        raise FileSizeError(f"File size ({file_size_mb:.1f}MB) exceeds limit ({max_size_mb}MB)")
     
     # Ensure parent directory exists for new files
-    if not must_exist:
+    if not must_exist and file_size is None:
         path.parent.mkdir(parents=True, exist_ok=True)
     
     return path
@@ -103,6 +108,11 @@ def validate_cell_position(
         )
 
 
+# Cell value types accepted in table data, and the same as an exact-type set
+_BASIC_CELL_TYPES = (str, int, float, bool, type(None))
+_BASIC_CELL_TYPE_SET = frozenset(_BASIC_CELL_TYPES)
+
+
 def validate_table_data(data: List[List[str]]) -> None:
     """
     Validate table data format.
@@ -119,24 +129,26 @@ def validate_table_data(data: List[List[str]]) -> None:
     if not data:
         raise DataFormatError("Table data cannot be empty")
     
-    # Check that all rows are lists
+    # Check every row in one pass: it must be a list of the same length as
+    # row 0 holding only basic values. The exact-type set lookup accepts the
+    # usual rows without an isinstance call per cell.
+    first_row_length = None
     for i, row in enumerate(data):
         if not isinstance(row, list):
             raise DataFormatError(f"Row {i} must be a list, got: {type(row)}")
-    
-    # Check that all rows have the same length
-    first_row_length = len(data[0])
-    for i, row in enumerate(data[1:], 1):
-        if len(row) != first_row_length:
+        
+        if first_row_length is None:
+            first_row_length = len(row)
+        elif len(row) != first_row_length:
             raise DataFormatError(
                 f"All rows must have the same length. Row 0 has {first_row_length} "
                 f"columns, but row {i} has {len(row)} columns."
             )
-    
-    # Convert all values to strings and validate
-    for i, row in enumerate(data):
+        
+        if all(type(cell) in _BASIC_CELL_TYPE_SET for cell in row):
+            continue
         for j, cell in enumerate(row):
-            if not isinstance(cell, (str, int, float, bool, type(None))):
+            if not isinstance(cell, _BASIC_CELL_TYPES):
                 raise DataFormatError(
                     f"Cell value at row {i}, column {j} must be a basic type "
                     f"(str, int, float, bool, or None), got: {type(cell)}"
@@ -160,6 +172,10 @@ def validate_position_parameter(position: str, valid_positions: List[str]) -> No
         )
 
 
+# str.translate table deleting C0 control characters other than tab and newline
+_CONTROL_CHAR_TABLE = dict.fromkeys(c for c in range(32) if c not in (9, 10))
+
+
 def sanitize_string(value: Any) -> str:
     """
     Sanitize and convert value to string.
@@ -176,7 +192,10 @@ def sanitize_string(value: Any) -> str:
     # Convert to string
     str_value = str(value)
     
-    # Remove any control characters except newlines and tabs
-    sanitized = "".join(char for char in str_value if ord(char) >= 32 or char in "\n\t")
+    # Printable strings contain no control characters, and the check runs
+    # in C without building a new string
+    if str_value.isprintable():
+        return str_value
     
-    return sanitized
+    # Remove any control characters except newlines and tabs
+    return str_value.translate(_CONTROL_CHAR_TABLE)
@@ -2,9 +2,7 @@
 
 import os
 import sys
-import tempfile
 import pytest
-from pathlib import Path
 
 # Add the src directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -14,10 +12,10 @@ from docx_mcp.operations.tables.table_operations import TableOperations
 
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
     """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        yield Path(tmp_dir)
+    # Each test, and so each pytest-xdist worker, gets its own directory
+    return tmp_path
 
 
 @pytest.fixture
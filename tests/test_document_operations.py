@@ -120,3 +120,58 @@ class TestDocumentOperations:
         assert result.data['count'] == 2
         assert str(test_doc_path) in result.data['loaded_documents']
         assert str(doc2_path) in result.data['loaded_documents']
+
+    @pytest.mark.unit
+    def test_cached_document_reloads_after_external_change(self, document_manager, test_doc_path):
+        """Test that a cached document is re-read when its file changes on disk."""
+        from docx_mcp.core.document_manager import DocumentManager
+        
+        path = str(test_doc_path)
+        document_manager.open_document(path, create_if_not_exists=True)
+        document_manager.save_document(path)
+        cached = document_manager.get_cached_or_load(path)
+        assert document_manager.get_cached_or_load(path) is cached
+        
+        # Another process rewrites the file
+        other = DocumentManager()
+        other_doc = other.get_or_load_document(path)
+        other_doc.add_table(rows=1, cols=1)
+        other.save_document(path)
+        
+        reloaded = document_manager.get_cached_or_load(path)
+        assert reloaded is not cached
+        assert len(reloaded.tables) == 1
+
+    @pytest.mark.unit
+    def test_reopen_reuses_unchanged_document(self, document_manager, table_operations, test_doc_path):
+        """Test that reopening an unchanged file skips the parse but still drops unsaved edits."""
+        path = str(test_doc_path)
+        document_manager.open_document(path, create_if_not_exists=True)
+        document_manager.save_document(path)
+        document_manager.open_document(path)
+        cached = document_manager.get_document(path)
+        
+        document_manager.open_document(path)
+        assert document_manager.get_document(path) is cached
+        
+        table_operations.create_table(path, rows=1, cols=1)
+        document_manager.open_document(path)
+        reopened = document_manager.get_document(path)
+        assert reopened is not cached
+        assert len(reopened.tables) == 0
+
+    @pytest.mark.unit
+    def test_cached_document_keeps_unsaved_changes(self, document_manager, table_operations, test_doc_path):
+        """Test that unsaved in-memory edits are not replaced by a reload."""
+        from docx_mcp.core.document_manager import DocumentManager
+        
+        path = str(test_doc_path)
+        document_manager.open_document(path, create_if_not_exists=True)
+        document_manager.save_document(path)
+        table_operations.create_table(path, rows=2, cols=2)
+        
+        other = DocumentManager()
+        other.get_or_load_document(path).add_paragraph("external edit")
+        other.save_document(path)
+        
+        assert len(document_manager.get_cached_or_load(path).tables) == 1
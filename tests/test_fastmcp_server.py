@@ -1,9 +1,9 @@
 """Tests for FastMCP server integration."""
 
-import os
+import asyncio
+import time
 import pytest
 from unittest.mock import Mock, patch
-import tempfile
 from pathlib import Path
 
 from docx_mcp.server import (
@@ -65,17 +65,10 @@ class TestServerIntegration:
     """Test server integration with underlying operations."""
 
     @pytest.fixture
-    def temp_doc_path(self):
+    def temp_doc_path(self, tmp_path):
         """Create a temporary document path."""
-        # Create a temporary file path without creating the file
-        temp_dir = Path(tempfile.gettempdir())
-        temp_file = temp_dir / f"test_docx_{os.getpid()}_{id(self)}.docx"
-        
-        yield str(temp_file)
-        
-        # Cleanup
-        if temp_file.exists():
-            temp_file.unlink()
+        # A path in the test's own directory, without creating the file
+        return str(tmp_path / "test_docx.docx")
 
     @pytest.mark.integration
     def test_document_manager_integration(self, temp_doc_path):
@@ -174,4 +167,137 @@ class TestServerIntegration:
         
         # Try to get cell from non-existent table
         result = table_operations.get_cell_value(temp_doc_path, 999, 0, 0)
-        assert result.status.value == 'error'
\ No newline at end of file
+        assert result.status.value == 'error'
+
+    @pytest.mark.integration
+    def test_save_as_keeps_documents_separate(self, tmp_path):
+        """Test that saving under a new name does not share one document between both paths."""
+        from docx_mcp.server import open_document, create_table, save_document, list_tables
+        original_path = str(tmp_path / "original.docx")
+        copy_path = str(tmp_path / "copy.docx")
+        
+        async def scenario():
+            await open_document(original_path, create_if_not_exists=True)
+            await create_table(original_path, rows=2, cols=2)
+            await save_document(original_path, save_as=copy_path)
+            # An edit through the original path must not show up in the copy
+            await create_table(original_path, rows=1, cols=1)
+            return await list_tables(original_path), await list_tables(copy_path)
+        
+        original_tables, copy_tables = asyncio.run(scenario())
+        
+        assert original_tables['data']['total_count'] == 2
+        assert copy_tables['data']['total_count'] == 1
+        assert document_manager.get_document(original_path) is not document_manager.get_document(copy_path)
+
+    @pytest.mark.unit
+    def test_tool_calls_lock_per_resolved_file(self, tmp_path, monkeypatch):
+        """Test that calls on one file never overlap, whatever its spelling, and locks are released."""
+        from docx_mcp import server
+        from docx_mcp.models.responses import OperationResponse
+        monkeypatch.chdir(tmp_path)
+        active = []
+        overlaps = []
+        
+        def slow_operation(file_path, *args):
+            if active:
+                overlaps.append((tuple(active), file_path))
+            active.append(file_path)
+            time.sleep(0.05)
+            active.remove(file_path)
+            return OperationResponse.success("ok")
+        
+        async def scenario():
+            await asyncio.gather(
+                server._run_blocking(slow_operation, "doc.docx"),
+                server._run_blocking(slow_operation, "./doc.docx"),
+                server._run_locked(("other.docx", "doc.docx"), slow_operation, "other.docx"),
+            )
+            
+            # A cancelled call keeps the lock until its worker thread is done
+            cancelled = asyncio.ensure_future(server._run_blocking(slow_operation, "doc.docx"))
+            await asyncio.sleep(0.01)
+            cancelled.cancel()
+            await asyncio.sleep(0)
+            await server._run_blocking(slow_operation, "doc.docx")
+            with pytest.raises(asyncio.CancelledError):
+                await cancelled
+        
+        asyncio.run(scenario())
+        
+        assert overlaps == []
+        assert server._file_locks == {}
+
+
+class TestFormattingTools:
+    """Test the formatting tools that take their options as a dictionary."""
+
+    @pytest.fixture
+    def table_doc_path(self, tmp_path):
+        """Create a document with one 2x2 table through the tools."""
+        from docx_mcp.server import open_document, create_table
+        path = str(tmp_path / "formatting.docx")
+        
+        async def setup():
+            await open_document(path, create_if_not_exists=True)
+            await create_table(path, rows=2, cols=2)
+        
+        asyncio.run(setup())
+        return path
+
+    @pytest.mark.integration
+    def test_format_cell_text_tool(self, table_doc_path):
+        """Test format_cell_text with valid, unknown and empty options."""
+        from docx_mcp.server import format_cell_text
+        
+        result = asyncio.run(format_cell_text(table_doc_path, 0, 0, 0, {"bold": True, "font_size": 14}))
+        assert result['status'] == 'success'
+        assert result['data']['formatting_applied'] == {"bold": True, "font_size": 14}
+        
+        result = asyncio.run(format_cell_text(table_doc_path, 0, 0, 0, {"Bold": True}))
+        assert result['status'] == 'error'
+        assert "Bold" in result['message']
+        
+        result = asyncio.run(format_cell_text(table_doc_path, 0, 0, 0, {}))
+        assert result['status'] == 'error'
+
+    @pytest.mark.integration
+    def test_format_cell_borders_tool(self, table_doc_path):
+        """Test format_cell_borders with valid, unknown and empty borders."""
+        from docx_mcp.server import format_cell_borders
+        
+        result = asyncio.run(format_cell_borders(table_doc_path, 0, 0, 0, {"top": {"style": "double"}}))
+        assert result['status'] == 'success'
+        assert result['data']['borders_applied'] == {
+            "top": {"style": "double", "width": "thin", "color": "000000"}
+        }
+        
+        for borders in ({"Top": {"style": "double"}}, {"top": {"Style": "double"}}, {"top": "double"}, {}):
+            result = asyncio.run(format_cell_borders(table_doc_path, 0, 0, 0, borders))
+            assert result['status'] == 'error', borders
+
+    @pytest.mark.integration
+    def test_formatting_tool_schemas_list_allowed_keys(self, table_doc_path):
+        """Test that the tool schemas publish the allowed keys and reject others."""
+        from fastmcp import Client
+        from fastmcp.exceptions import ToolError
+        from docx_mcp.server import mcp
+        
+        async def scenario():
+            async with Client(mcp) as client:
+                tools = {tool.name: tool for tool in await client.list_tools()}
+                with pytest.raises(ToolError):
+                    await client.call_tool("format_cell_borders", {
+                        "file_path": table_doc_path, "table_index": 0, "row_index": 0,
+                        "column_index": 0, "borders": {"Top": {"style": "double"}}
+                    })
+                return tools
+        
+        tools = asyncio.run(scenario())
+        
+        text_schema = tools["format_cell_text"].input_schema["properties"]["text_format"]
+        assert text_schema["additionalProperties"] is False
+        assert "bold" in text_schema["properties"]
+        borders_schema = tools["format_cell_borders"].input_schema["properties"]["borders"]
+        assert borders_schema["additionalProperties"] is False
+        assert set(borders_schema["properties"]) == {"top", "bottom", "left", "right"}
@@ -366,6 +366,20 @@ class TestFormattingModels:
         assert border.style == BorderStyle.DASHED
         assert border.width == BorderWidth.THICK
         assert border.color == "FF0000"
+    
+    @pytest.mark.unit
+    def test_formatting_models_are_immutable(self):
+        """Test that formatting models are frozen and hashable."""
+        text_format = TextFormat(bold=True, font_size=12)
+        
+        with pytest.raises(AttributeError):
+            text_format.bold = False
+        
+        assert text_format == TextFormat.from_dict({"bold": True, "font_size": 12})
+        assert hash(text_format) == hash(TextFormat(bold=True, font_size=12))
+        
+        borders = CellBorders.from_dict({"top": {"style": "double"}})
+        assert hash(borders) == hash(CellBorders(top=BorderProperties(style=BorderStyle.DOUBLE)))
 
 
 class TestColorValidation:
@@ -108,6 +108,91 @@ class TestTableStructureOperations:
         assert result.status == ResponseStatus.SUCCESS
         assert result.data['columns_added'] == 1
 
+    @pytest.mark.unit
+    def test_add_table_columns_cells_are_valid(self, document_manager, table_operations, test_doc_path):
+        """Test that inserted cells hold a paragraph and land at the requested column."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=2, cols=2, headers=["A", "B"])
+        
+        result = table_operations.add_table_columns(
+            str(test_doc_path), table_index=0, count=2, position="at_index", column_index=1
+        )
+        assert result.status == ResponseStatus.SUCCESS
+        
+        table = document_manager.get_document(str(test_doc_path)).tables[0]
+        for tr in table._tbl.tr_lst:
+            assert len(tr.tc_lst) == 4
+            assert all(tc.p_lst for tc in tr.tc_lst)
+        assert [tc.xpath('string(.)') for tc in table._tbl.tr_lst[0].tc_lst] == ["A", "", "", "B"]
+
+    @pytest.mark.unit
+    def test_add_table_rows_copies_cell_properties(self, document_manager, table_operations, test_doc_path):
+        """Test that copied row styles bring the cell properties but not the reference layout."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=1, cols=3)
+        table_operations.set_cell_value(
+            str(test_doc_path), 0, 0, 0, "Head",
+            alignment={"vertical": "middle"}, background_color="#ff0000"
+        )
+        table = document_manager.get_document(str(test_doc_path)).tables[0]
+        table.cell(0, 1).merge(table.cell(0, 2))
+        
+        result = table_operations.add_table_rows(str(test_doc_path), 0, count=1, copy_style_from_row=0)
+        assert result.status == ResponseStatus.SUCCESS
+        
+        new_tcs = table._tbl.tr_lst[1].tc_lst
+        assert len(new_tcs) == 3
+        first = new_tcs[0].tcPr
+        assert first.xpath('string(w:shd/@w:fill)') == "FF0000"
+        assert first.xpath('string(w:vAlign/@w:val)') == "center"
+        assert all(tc.grid_span == 1 for tc in new_tcs)
+        assert all(tc.tcPr.tcW is not None for tc in new_tcs)
+
+    @pytest.mark.unit
+    def test_add_table_rows_copies_run_formatting_without_text(self, document_manager, table_operations, test_doc_path):
+        """Test that copied row styles bring run formatting but leave the new cells empty."""
+        from docx_mcp.models.formatting import TextFormat
+        
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=1, cols=1)
+        table_operations.set_cell_value(
+            str(test_doc_path), 0, 0, 0, "Head",
+            text_format=TextFormat(bold=True, font_size=14)
+        )
+        
+        result = table_operations.add_table_rows(str(test_doc_path), 0, count=1, copy_style_from_row=0)
+        assert result.status == ResponseStatus.SUCCESS
+        
+        table = document_manager.get_document(str(test_doc_path)).tables[0]
+        new_cell = table.rows[1].cells[0]
+        assert new_cell.text == ""
+        run = new_cell.paragraphs[0].runs[0]
+        assert run.bold is True
+        assert run.font.size.pt == 14
+
+    @pytest.mark.unit
+    def test_add_table_rows_positions(self, document_manager, table_operations, test_doc_path):
+        """Test inserting rows at the beginning and at an index."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=3, cols=1)
+        table_operations.set_cells(str(test_doc_path), 0, [
+            {"row_index": i, "column_index": 0, "value": f"r{i}"} for i in range(3)
+        ])
+        
+        result = table_operations.add_table_rows(str(test_doc_path), 0, count=2, position="at_index", row_index=1)
+        assert result.status == ResponseStatus.SUCCESS
+        assert result.data['new_row_count'] == 5
+        
+        result = table_operations.add_table_rows(str(test_doc_path), 0, count=1, position="beginning")
+        assert result.status == ResponseStatus.SUCCESS
+        
+        data = table_operations.get_table_data(str(test_doc_path), 0, include_headers=False).data
+        assert data['data'] == [[""], ["r0"], [""], [""], ["r1"], ["r2"]]
+        
+        # Rows must stay after the table properties and grid
+        tbl = document_manager.get_document(str(test_doc_path)).tables[0]._tbl
+        assert tbl[0].tag.endswith('}tblPr')
+
     @pytest.mark.unit
     def test_delete_table_rows(self, document_manager, table_operations, test_doc_path):
         """Test deleting rows from a table."""
@@ -123,6 +208,24 @@ class TestTableStructureOperations:
         assert result.status == ResponseStatus.SUCCESS
         assert result.data['rows_deleted'] == 2
 
+    @pytest.mark.unit
+    def test_delete_table_rows_contiguous_ranges(self, document_manager, table_operations, test_doc_path):
+        """Test deleting runs of adjacent rows keeps the remaining rows in order."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=7, cols=1)
+        table_operations.set_cells(str(test_doc_path), 0, [
+            {"row_index": i, "column_index": 0, "value": f"r{i}"} for i in range(7)
+        ])
+        
+        result = table_operations.delete_table_rows(str(test_doc_path), 0, [5, 1, 2, 3, 2])
+        
+        assert result.status == ResponseStatus.SUCCESS
+        assert result.data['rows_deleted'] == 4
+        assert result.data['remaining_rows'] == 3
+        
+        data = table_operations.get_table_data(str(test_doc_path), 0, include_headers=False).data
+        assert data['data'] == [["r0"], ["r4"], ["r6"]]
+
 
 class TestTableDataOperations:
     """Test table data operations."""
@@ -229,6 +332,40 @@ class TestTableDataOperations:
         if result.data['data']:  # If there's data
             assert isinstance(result.data['data'][0], dict)
 
+    @pytest.mark.unit
+    def test_get_table_data_csv_format(self, document_manager, table_operations, test_doc_path):
+        """Test getting table data as a CSV string, or as rows with csv_as_list."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=2, cols=2, headers=["Name", "Note"])
+        table_operations.set_cell_value(str(test_doc_path), 0, 1, 0, "Alice")
+        table_operations.set_cell_value(str(test_doc_path), 0, 1, 1, 'says "hi", twice')
+        
+        result = table_operations.get_table_data(str(test_doc_path), 0, format_type="csv")
+        
+        assert result.status == ResponseStatus.SUCCESS
+        assert result.data['data'] == 'Name,Note\r\nAlice,"says ""hi"", twice"\r\n'
+        
+        result = table_operations.get_table_data(
+            str(test_doc_path), 0, format_type="csv", csv_as_list=True
+        )
+        assert result.data['data'] == [["Name", "Note"], ["Alice", 'says "hi", twice']]
+
+    @pytest.mark.unit
+    def test_get_table_data_repeated_reads(self, document_manager, table_operations, test_doc_path):
+        """Test that repeated reads see edits and are not affected by callers changing results."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=2, cols=1, headers=["Name"])
+        
+        first = table_operations.get_table_data(str(test_doc_path), 0, include_headers=False)
+        first.data['data'][0][0] = "changed by caller"
+        
+        second = table_operations.get_table_data(str(test_doc_path), 0, include_headers=False)
+        assert second.data['data'] == [["Name"], [""]]
+        
+        table_operations.set_cell_value(str(test_doc_path), 0, 1, 0, "Alice")
+        third = table_operations.get_table_data(str(test_doc_path), 0, include_headers=False)
+        assert third.data['data'] == [["Name"], ["Alice"]]
+
     @pytest.mark.unit
     def test_get_table_data_invalid_format(self, table_operations, test_doc_path, setup_table):
         """Test getting table data with invalid format."""
@@ -388,6 +525,180 @@ class TestTableSearchOperations:
         assert matches[1]['cell_value'] == "World Peace"
         assert matches[1]['match_text'] == "World"
 
+    @pytest.mark.unit
+    def test_search_table_content_contains_overlapping(self, document_manager, table_operations, test_doc_path):
+        """Test that contains mode reports overlapping occurrences."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=1, cols=1)
+        table_operations.set_cell_value(str(test_doc_path), 0, 0, 0, "AAaa")
+        
+        result = table_operations.search_table_content(str(test_doc_path), "aa", search_mode="contains")
+        assert [m['match_start'] for m in result.data['matches']] == [0, 1, 2]
+        assert [m['match_text'] for m in result.data['matches']] == ["AA", "Aa", "aa"]
+        
+        result = table_operations.search_table_headers(str(test_doc_path), "aa", search_mode="contains")
+        assert [m['match_start'] for m in result.data['matches']] == [0, 1, 2]
+
+    @pytest.mark.unit
+    def test_search_table_content_skips_tables_without_hits(self, document_manager, table_operations, test_doc_path):
+        """Test that tables rejected as a whole still count their cells as searched."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=2, cols=2, headers=["a", "b"])
+        table_operations.create_table(str(test_doc_path), rows=1, cols=2, headers=["Target", "other"])
+        
+        result = table_operations.search_table_content(str(test_doc_path), "target", search_mode="exact")
+        
+        assert result.status == ResponseStatus.SUCCESS
+        assert [(m['table_index'], m['column_index']) for m in result.data['matches']] == [(1, 0)]
+        assert result.data['summary']['total_cells_searched'] == 6
+
+    @pytest.mark.unit
+    def test_search_table_content_sees_edits_between_searches(self, document_manager, table_operations, test_doc_path):
+        """Test that cached cell texts are refreshed after the table is edited."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=1, cols=2, headers=["Alpha", "Beta"])
+        
+        first = table_operations.search_table_content(str(test_doc_path), "gamma")
+        assert first.data['total_matches'] == 0
+        
+        table_operations.set_cell_value(str(test_doc_path), 0, 0, 1, "Gamma")
+        second = table_operations.search_table_content(str(test_doc_path), "gamma")
+        assert [(m['row_index'], m['column_index']) for m in second.data['matches']] == [(0, 1)]
+
+    @pytest.mark.unit
+    def test_search_table_content_merged_cells(self, document_manager, table_operations, test_doc_path):
+        """Test that a horizontally merged cell is reported at every grid position it spans."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        
+        table_operations.create_table(str(test_doc_path), rows=2, cols=2)
+        table = document_manager.get_document(str(test_doc_path)).tables[0]
+        merged = table.cell(0, 0).merge(table.cell(0, 1))
+        merged.text = "Merged Header"
+        
+        result = table_operations.search_table_content(str(test_doc_path), "merged", search_mode="contains")
+        
+        assert result.status == ResponseStatus.SUCCESS
+        assert [(m['row_index'], m['column_index']) for m in result.data['matches']] == [(0, 0), (0, 1)]
+        assert all(m['match_text'] == "Merged" for m in result.data['matches'])
+        
+        data = table_operations.get_table_data(str(test_doc_path), 0, include_headers=False).data
+        assert data['data'][0] == ["Merged Header", "Merged Header"]
+
+    @pytest.mark.unit
+    def test_search_table_content_regex_skips_empty_cells(self, document_manager, table_operations, test_doc_path):
+        """Test that patterns matching the empty string only report non-empty cells."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=1, cols=3)
+        table_operations.set_cell_value(str(test_doc_path), 0, 0, 1, "Keep")
+        
+        result = table_operations.search_table_content(str(test_doc_path), "^k?", search_mode="regex")
+        
+        assert result.status == ResponseStatus.SUCCESS
+        assert [(m['column_index'], m['match_text']) for m in result.data['matches']] == [(1, "K")]
+
+    @pytest.mark.unit
+    def test_search_table_content_regex_required_literal(self, document_manager, table_operations, test_doc_path):
+        """Test regex search where the required literal is not at the start of the pattern."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=1, cols=2)
+        table_operations.create_table(str(test_doc_path), rows=1, cols=2)
+        table_operations.set_cell_value(str(test_doc_path), 0, 0, 0, "no match here")
+        table_operations.set_cell_value(str(test_doc_path), 1, 0, 1, "12 Units, 7 units")
+        table_operations.set_cell_value(str(test_doc_path), 1, 0, 0, "\u212a units")
+        
+        result = table_operations.search_table_content(str(test_doc_path), r"\d{1,3} units", search_mode="regex")
+        assert [(m['table_index'], m['match_text']) for m in result.data['matches']] == [
+            (1, "12 Units"), (1, "7 units")
+        ]
+        
+        # Under IGNORECASE the Kelvin sign matches "k"
+        result = table_operations.search_table_content(str(test_doc_path), "k units", search_mode="regex")
+        assert [(m['table_index'], m['column_index']) for m in result.data['matches']] == [(1, 0)]
+
+    @pytest.mark.unit
+    def test_search_table_content_regex_escapes_and_classes(self, document_manager, table_operations, test_doc_path):
+        """Test regex search with character escapes and a leading ']' in a class."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=1, cols=3)
+        table_operations.set_cell_value(str(test_doc_path), 0, 0, 0, "ABC")
+        table_operations.set_cell_value(str(test_doc_path), 0, 0, 1, "AA")
+        table_operations.set_cell_value(str(test_doc_path), 0, 0, 2, "]x")
+        
+        for query, expected in [
+            (r"\x41BC", ["ABC"]),
+            (r"\101", ["A", "A", "A"]),
+            (r"[]abc]x", ["]x"]),
+            (r"[^]abc]BC", ["ABC"]),
+        ]:
+            result = table_operations.search_table_content(
+                str(test_doc_path), query, search_mode="regex", case_sensitive=True
+            )
+            assert [m['match_text'] for m in result.data['matches']] == expected, query
+
+    @pytest.mark.unit
+    def test_search_table_content_regex_with_re2(self, document_manager, table_operations, test_doc_path, monkeypatch):
+        """Test that case-insensitive regex search runs on RE2 when it is installed."""
+        from docx_mcp.operations.tables import table_operations as table_operations_module
+        
+        searched = []
+        
+        class FakeRE2Pattern:
+            def __init__(self, compiled):
+                self._compiled = compiled
+            
+            def finditer(self, text):
+                searched.append(text)
+                return self._compiled.finditer(text)
+        
+        class FakeRE2:
+            """Stands in for google-re2, whose \\d and \\w only match ASCII."""
+            error = re.error
+            
+            class Options:
+                case_sensitive = True
+                log_errors = True
+            
+            @staticmethod
+            def compile(query, options):
+                flags = re.ASCII if options.case_sensitive else re.ASCII | re.IGNORECASE
+                return FakeRE2Pattern(re.compile(query, flags))
+        
+        monkeypatch.setattr(table_operations_module, "re2", FakeRE2)
+        table_operations_module._compile_re2.cache_clear()
+        try:
+            document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+            table_operations.create_table(str(test_doc_path), rows=1, cols=2)
+            table_operations.set_cell_value(str(test_doc_path), 0, 0, 0, "Total 12 ITEMS")
+            table_operations.set_cell_value(str(test_doc_path), 0, 0, 1, "\u0663 items")
+            
+            result = table_operations.search_table_content(str(test_doc_path), "total", search_mode="regex")
+            assert [m['match_text'] for m in result.data['matches']] == ["Total"]
+            assert searched == ["Total 12 ITEMS", "\u0663 items"]
+            
+            # RE2's ASCII-only \d would miss the Arabic-Indic digit, so the
+            # non-ASCII cell is searched with re
+            searched.clear()
+            result = table_operations.search_table_content(str(test_doc_path), r"\d+ items", search_mode="regex")
+            assert [m['match_text'] for m in result.data['matches']] == ["12 ITEMS", "\u0663 items"]
+            assert searched == ["Total 12 ITEMS"]
+        finally:
+            table_operations_module._compile_re2.cache_clear()
+
+    @pytest.mark.unit
+    def test_search_table_content_repeated_after_edit(self, document_manager, table_operations, test_doc_path):
+        """Test that repeated searches see cell edits made between them."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=2, cols=2)
+        table_operations.set_cell_value(str(test_doc_path), 0, 0, 0, "alpha")
+        
+        result = table_operations.search_table_content(str(test_doc_path), "beta")
+        assert result.data['total_matches'] == 0
+        assert result.data['summary']['total_cells_searched'] == 4
+        
+        table_operations.set_cell_value(str(test_doc_path), 0, 1, 1, "beta")
+        result = table_operations.search_table_content(str(test_doc_path), "beta")
+        assert [(m['row_index'], m['column_index']) for m in result.data['matches']] == [(1, 1)]
+
     @pytest.mark.unit
     def test_search_table_content_exact_mode(self, document_manager, table_operations, test_doc_path):
         """Test table content search with exact mode."""
@@ -534,6 +845,102 @@ class TestTableSearchOperations:
         assert result.data['matches'][0]['cell_value'] == "Email"
         assert result.data['summary']['search_type'] == "headers_only"
 
+    @pytest.mark.unit
+    def test_search_table_headers_max_matches(self, document_manager, table_operations, test_doc_path):
+        """Test that header search stops early once max_matches is reached."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=2, cols=3, headers=["Total", "Sub Total", "Note"])
+        table_operations.create_table(str(test_doc_path), rows=2, cols=1, headers=["Total"])
+        
+        for mode, query in [("contains", "total"), ("regex", "total")]:
+            result = table_operations.search_table_headers(
+                str(test_doc_path), query, search_mode=mode, max_matches=2
+            )
+            assert result.status == ResponseStatus.SUCCESS
+            assert result.data['total_matches'] == 2
+            assert [m['column_index'] for m in result.data['matches']] == [0, 1]
+            assert result.data['summary']['truncated'] is True
+            assert "limited to 2" in result.message
+        
+        result = table_operations.search_table_headers(str(test_doc_path), "total")
+        assert result.data['total_matches'] == 3
+        assert result.data['summary']['truncated'] is False
+
+    @pytest.mark.unit
+    def test_search_table_headers_regex_mode(self, document_manager, table_operations, test_doc_path):
+        """Test regex search in table headers."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=2, cols=3, headers=["Q1 2024", "Q2 2024", "Total"])
+        
+        result = table_operations.search_table_headers(str(test_doc_path), r"q\d", search_mode="regex")
+        
+        assert result.status == ResponseStatus.SUCCESS
+        assert result.data['total_matches'] == 2
+        assert [m['match_text'] for m in result.data['matches']] == ["Q1", "Q2"]
+        assert result.data['matches'][1]['match_start'] == 0
+        assert result.data['matches'][1]['match_end'] == 2
+        
+        result = table_operations.search_table_headers(str(test_doc_path), r"q\d", search_mode="regex", case_sensitive=True)
+        assert result.data['total_matches'] == 0
+
+    @pytest.mark.unit
+    def test_search_table_headers_regex_literal_prefix(self, document_manager, table_operations, test_doc_path):
+        """Test regex header search with a leading literal."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=2, cols=3, headers=["Table 12", "table", "Tabs 3"])
+        
+        result = table_operations.search_table_headers(str(test_doc_path), r"table\s+\d+", search_mode="regex")
+        assert result.status == ResponseStatus.SUCCESS
+        assert [m['match_text'] for m in result.data['matches']] == ["Table 12"]
+        
+        # The optional "l" must not be part of the required prefix
+        result = table_operations.search_table_headers(str(test_doc_path), r"Tabl?", search_mode="regex", case_sensitive=True)
+        assert [m['match_text'] for m in result.data['matches']] == ["Tabl", "Tab"]
+
+    @pytest.mark.unit
+    def test_search_table_headers_batch(self, document_manager, table_operations, test_doc_path):
+        """Test searching table headers for several queries at once."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        
+        table_operations.create_table(str(test_doc_path), rows=2, cols=3, headers=["Name", "Email", "Phone"])
+        table_operations.create_table(str(test_doc_path), rows=2, cols=2, headers=["Username", "Email Address"])
+        
+        result = table_operations.search_table_headers_batch(
+            str(test_doc_path), ["email", "name", "Fax"]
+        )
+        
+        assert result.status == ResponseStatus.SUCCESS
+        assert result.data['total_matches'] == 4
+        email, name, fax = result.data['results']
+        assert email['query'] == "email"
+        assert [(m['table_index'], m['column_index']) for m in email['matches']] == [(0, 1), (1, 1)]
+        assert email['matches'][1]['match_text'] == "Email"
+        assert [(m['table_index'], m['column_index'], m['match_start']) for m in name['matches']] == [(0, 0, 0), (1, 0, 4)]
+        assert name['summary']['tables_with_header_matches'] == 2
+        assert fax['total_matches'] == 0
+
+    @pytest.mark.unit
+    def test_search_table_headers_batch_without_automaton(self, document_manager, table_operations, test_doc_path, monkeypatch):
+        """Test batch header search falls back to str.find without pyahocorasick."""
+        from docx_mcp.operations.tables import table_operations as table_operations_module
+        monkeypatch.setattr(table_operations_module, "ahocorasick", None)
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=2, cols=2, headers=["aaa", "Name"])
+        
+        result = table_operations.search_table_headers_batch(
+            str(test_doc_path), ["aa", "NAME", "name"], case_sensitive=False
+        )
+        
+        assert result.status == ResponseStatus.SUCCESS
+        aa, upper_name, lower_name = result.data['results']
+        assert [m['match_start'] for m in aa['matches']] == [0, 1]  # Overlapping matches
+        assert upper_name['total_matches'] == 1
+        assert lower_name['total_matches'] == 1
+        
+        result = table_operations.search_table_headers_batch(str(test_doc_path), ["name", " "])
+        assert result.status == ResponseStatus.ERROR
+        assert "empty" in result.message.lower()
+
     @pytest.mark.unit
     def test_search_table_content_empty_query(self, document_manager, table_operations, test_doc_path):
         """Test search with empty query."""
@@ -692,6 +1099,45 @@ class TestTableAnalysisOperations:
         assert 'alignment' in style_consistency
         assert 'borders' in style_consistency
 
+    @pytest.mark.unit
+    def test_analyze_table_structure_vertical_merge(self, document_manager, table_operations, test_doc_path):
+        """Test that a merged cell is reported at each position but as a single merge region."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=3, cols=2)
+        table = document_manager.get_document(str(test_doc_path)).tables[0]
+        merged = table.cell(0, 0).merge(table.cell(2, 0))
+        merged.text = "Group"
+        
+        result = table_operations.analyze_table_structure(str(test_doc_path), 0)
+        
+        assert result.status == ResponseStatus.SUCCESS
+        cells = result.data['cells']
+        assert [row[0]['content']['text'] for row in cells] == ["Group", "Group", "Group"]
+        assert [(row[0]['position']['row'], row[0]['position']['column']) for row in cells] == [(0, 0), (1, 0), (2, 0)]
+        assert result.data['merge_analysis']['merged_cells_count'] == 3
+        assert len(result.data['merge_analysis']['merge_regions']) == 1
+        assert cells[0][0]['merge']['type'] == "vertical"
+        assert (cells[0][0]['merge']['start_row'], cells[0][0]['merge']['end_row']) == (0, 2)
+        assert cells[0][0]['merge']['span_rows'] == 3
+        assert cells[0][1]['merge'] is None
+
+    @pytest.mark.unit
+    def test_analyze_table_structure_horizontal_merge(self, document_manager, table_operations, test_doc_path):
+        """Test that a gridSpan merge is detected with its column span."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=2, cols=3)
+        table = document_manager.get_document(str(test_doc_path)).tables[0]
+        table.cell(1, 0).merge(table.cell(1, 1))
+        
+        result = table_operations.analyze_table_structure(str(test_doc_path), 0)
+        
+        assert result.status == ResponseStatus.SUCCESS
+        regions = result.data['merge_analysis']['merge_regions']
+        assert len(regions) == 1
+        assert regions[0]['type'] == "horizontal"
+        assert (regions[0]['start_col'], regions[0]['end_col'], regions[0]['span_cols']) == (0, 1, 2)
+        assert result.data['merge_analysis']['merged_cells_count'] == 2
+
     @pytest.mark.unit
     def test_analyze_table_structure_cell_details(self, document_manager, table_operations, test_doc_path, setup_formatted_table):
         """Test table structure analysis with detailed cell information."""
@@ -883,6 +1329,38 @@ class TestTableAnalysisOperations:
         assert table['table_info']['columns'] == 2
         assert table['header_info']['has_header'] is True
 
+    @pytest.mark.unit
+    def test_analyze_all_tables_style_summary_matches_single_table(self, document_manager, table_operations, test_doc_path):
+        """Test that the all-tables style summary agrees with the per-table analysis."""
+        from docx_mcp.models.formatting import TextFormat
+        
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=3, cols=3, headers=["A", "B", "C"])
+        table_operations.set_cell_value(
+            str(test_doc_path), 0, 1, 0, "x",
+            text_format=TextFormat(font_family="Arial", font_size=11, font_color="#112233"),
+            alignment={"horizontal": "center"}, background_color="#ffeeaa"
+        )
+        table_operations.set_cell_value(
+            str(test_doc_path), 0, 1, 1, "y",
+            text_format=TextFormat(font_family="Calibri", font_size=14),
+            alignment={"horizontal": "justify"}
+        )
+        table_operations.formatting.format_cell_borders(
+            str(test_doc_path), 0, 2, 2, {"top": {"style": "dashed", "width": "thin", "color": "000000"}}
+        )
+        table = document_manager.get_document(str(test_doc_path)).tables[0]
+        table.cell(1, 2).merge(table.cell(2, 2))
+        
+        single = table_operations.analyze_table_structure(str(test_doc_path), 0, include_cell_details=True).data
+        summary = table_operations.analyze_all_tables(str(test_doc_path), include_cell_details=True).data['tables'][0]
+        
+        for key, values in single['style_summary'].items():
+            assert sorted(summary['style_summary'][key]) == sorted(values), key
+        assert summary['style_consistency'] == single['style_consistency']
+        assert sorted(single['style_summary']['font_families']) == ["Arial", "Calibri"]
+        assert single['style_consistency']['alignment'] is False
+
     @pytest.mark.unit
     def test_analyze_table_structure_style_consistency(self, document_manager, table_operations, test_doc_path):
         """Test style consistency analysis."""
@@ -1159,6 +1637,23 @@ class TestEnhancedCellOperations:
         assert applied_formatting['background_color'] == "FFFF00"
         assert data['value'] == "Yellow Background"
 
+    @pytest.mark.unit
+    def test_set_cell_value_background_color_normalized(self, document_manager, table_operations, test_doc_path):
+        """Test that background colors are normalized and invalid ones are ignored."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=2, cols=2)
+        
+        result = table_operations.set_cell_value(
+            str(test_doc_path), 0, 0, 0, "A", background_color="#ffcc00", preserve_existing_format=False
+        )
+        assert result.data['applied_formatting']['background_color'] == "FFCC00"
+        
+        result = table_operations.set_cell_value(
+            str(test_doc_path), 0, 0, 1, "B", background_color="yellow", preserve_existing_format=False
+        )
+        assert result.status == ResponseStatus.SUCCESS
+        assert result.data['applied_formatting']['background_color'] is None
+
     @pytest.mark.unit
     def test_set_cell_value_preserve_existing_format(self, table_operations, test_doc_path, setup_formatted_cell_table):
         """Test setting cell value while preserving existing formatting."""
@@ -1274,6 +1769,90 @@ class TestEnhancedCellOperations:
         assert result.status == ResponseStatus.SUCCESS
         assert result.data['value'] == "Test"
 
+    @pytest.mark.unit
+    def test_set_cell_value_without_reread(self, document_manager, table_operations, test_doc_path):
+        """Test that reported formatting matches a re-read when the re-read is skipped."""
+        from docx_mcp.models.formatting import TextFormat
+        
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=2, cols=2)
+        kwargs = dict(
+            text_format=TextFormat(font_family="Arial", font_size=12, font_color="FF0000", bold=True),
+            alignment={"horizontal": "center", "vertical": "middle"},
+            background_color="FFFF00",
+        )
+        
+        reread = table_operations.set_cell_value(str(test_doc_path), 0, 0, 0, "A", **kwargs)
+        written = table_operations.set_cell_value(
+            str(test_doc_path), 0, 0, 1, "A", return_applied_formatting=False, **kwargs
+        )
+        
+        assert written.status == ResponseStatus.SUCCESS
+        assert written.data['applied_formatting'] == reread.data['applied_formatting']
+
+    @pytest.mark.unit
+    def test_set_cell_value_unchanged_is_noop(self, document_manager, table_operations, test_doc_path):
+        """Test that rewriting the same plain value leaves the cell XML untouched."""
+        from docx_mcp.models.formatting import TextFormat
+        
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=2, cols=2)
+        table_operations.set_cell_value(str(test_doc_path), 0, 0, 0, "Same", text_format=TextFormat(bold=True))
+        
+        tc = document_manager.get_document(str(test_doc_path)).tables[0].cell(0, 0)._tc
+        run = tc.p_lst[0].r_lst[0]
+        
+        result = table_operations.set_cell_value(str(test_doc_path), 0, 0, 0, "Same")
+        assert result.status == ResponseStatus.SUCCESS
+        assert result.data['applied_formatting']['text_format']['bold'] is True
+        assert tc.p_lst[0].r_lst[0] is run
+        
+        result = table_operations.set_cell_value(str(test_doc_path), 0, 0, 0, "Different")
+        assert result.data['value'] == "Different"
+        assert result.data['applied_formatting']['text_format']['bold'] is True
+
+    @pytest.mark.unit
+    def test_set_cells_batch(self, document_manager, table_operations, test_doc_path):
+        """Test setting several cells in one call."""
+        from docx_mcp.models.tables import CellUpdate
+        
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=2, cols=2)
+        
+        result = table_operations.set_cells(str(test_doc_path), 0, [
+            {"row_index": 0, "column_index": 0, "value": "A", "bold": True},
+            {"row_index": 1, "column_index": 1, "value": "D", "background_color": "FFFF00"},
+            CellUpdate(row_index=0, column_index=1, value="B"),
+        ])
+        
+        assert result.status == ResponseStatus.SUCCESS
+        assert result.data['updated_cells'] == 3
+        assert result.data['errors'] == []
+        
+        cell = table_operations.get_cell_value(str(test_doc_path), 0, 0, 0).data
+        assert cell['value'] == "A"
+        assert cell['formatting']['text_format']['bold'] is True
+        assert table_operations.get_cell_value(str(test_doc_path), 0, 0, 1).data['value'] == "B"
+        cell = table_operations.get_cell_value(str(test_doc_path), 0, 1, 1).data
+        assert cell['formatting']['background_color'] == "FFFF00"
+
+    @pytest.mark.unit
+    def test_set_cells_invalid_position_writes_nothing(self, document_manager, table_operations, test_doc_path):
+        """Test that an invalid position rejects the whole batch."""
+        document_manager.open_document(str(test_doc_path), create_if_not_exists=True)
+        table_operations.create_table(str(test_doc_path), rows=2, cols=2)
+        
+        result = table_operations.set_cells(str(test_doc_path), 0, [
+            {"row_index": 0, "column_index": 0, "value": "A"},
+            {"row_index": 5, "column_index": 0, "value": "X"},
+        ])
+        
+        assert result.status == ResponseStatus.ERROR
+        assert table_operations.get_cell_value(str(test_doc_path), 0, 0, 0).data['value'] == ""
+        
+        result = table_operations.set_cells(str(test_doc_path), 0, [{"row_index": 0, "value": "A"}])
+        assert result.status == ResponseStatus.ERROR
+
     @pytest.mark.unit
     def test_enhanced_cell_operations_error_handling(self, table_operations):
         """Test error handling in enhanced cell operations."""